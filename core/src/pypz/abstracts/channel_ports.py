@@ -228,16 +228,23 @@ class ChannelInputPort(InputPortPlugin, ResourceHandlerPlugin, ExtendedPlugin, A
         return self._channel_reader.invoke_read_records()
 
     def can_retrieve(self) -> bool:
+        """
+        Records can be retrieved, while there are outputs not finished yet or there are
+        records still available. The outputs are checked first, since it is evaluated
+        locally on the tracked statuses, while has_records() may require a request to
+        the channel backend e.g., to a broker.
+        """
+
         if not self._channel_reader.is_channel_open():
             raise PermissionError(f"Method allowed only, if channel is open ({self.get_full_name()})")
 
-        finished_output_count = len(self._channel_reader.retrieve_connected_channel_unique_names(
+        finished_output_count = self._channel_reader.retrieve_connected_channel_count(
             lambda flt: ((self.get_group_name() is None) or
                          (flt.get_channel_group_name() != self.get_group_name())) and
                         ((not flt.is_channel_healthy()) or flt.is_channel_stopped() or flt.is_channel_closed())
-        ))
+        )
 
-        return self._channel_reader.has_records() or (self._expected_output_count > finished_output_count)
+        return (self._expected_output_count > finished_output_count) or self._channel_reader.has_records()
 
     def _on_port_close(self) -> bool:
         if self._channel_reader.is_channel_open():
@@ -358,6 +358,32 @@ class ChannelBase(ABC):
 
         return connected_channel_names
 
+    def retrieve_connected_channel_count(
+            self,
+            filter_function: Optional[Callable[[ChannelFilter], bool]] = None,
+            limit: Optional[int] = None
+    ) -> int:
+        """
+        This method returns the number of connected channels passing the evaluation
+        criteria passed as argument. Unlike retrieve_connected_channel_unique_names(),
+        it does not collect the names, hence it is preferred, if only the number
+        of matching channels is of interest.
+
+        :param filter_function: check_function check the ChannelFilter for more details (nullable)
+        :param limit: if specified, the counting stops, once this number is reached (nullable)
+        :return: number of connected channels that passes the given evaluation
+        """
+
+        connected_channel_count = 0
+
+        for val in self._status_map.copy().values():
+            if (filter_function is None) or filter_function(val):
+                connected_channel_count += 1
+                if (limit is not None) and (limit <= connected_channel_count):
+                    break
+
+        return connected_channel_count
+
     def retrieve_healthy_connected_channel_count(self) -> int:
         """
         Returns the number of healthy tracked input channels.
@@ -15,6 +15,7 @@
 # =============================================================================
 import time
 import unittest
+from unittest import mock
 
 from pypz.abstracts.channel_ports import ParamKeyChannelLocationConfig, ParamKeyChannelConfig, \
     ParamKeyPortOpenTimeoutMs, ChannelInputPort
@@ -380,6 +381,43 @@ class ChannelInputPortTest(unittest.TestCase):
             self.assertTrue(pipeline.reader.input_port_a._on_port_close())
             self.assertTrue(pipeline.writer.output_port._on_port_close())
 
+    def test_channel_input_port_can_retrieve(self):
+        pipeline = TestPipeline("pipeline")
+        pipeline.writer.output_port.set_parameter(ParamKeyChannelLocationConfig, "local")
+
+        pipeline.reader.input_port_a._pre_execution()
+        pipeline.writer.output_port._pre_execution()
+
+        self.assertTrue(pipeline.writer.output_port._on_resource_creation())
+        self.assertTrue(pipeline.reader.input_port_a._on_resource_creation())
+
+        self.assertTrue(pipeline.writer.output_port._on_port_open())
+        self.assertTrue(pipeline.reader.input_port_a._on_port_open())
+
+        channel_reader = pipeline.reader.input_port_a._channel_reader
+
+        try:
+            with self.subTest("unfinished output expect no records check"):
+                with mock.patch.object(channel_reader, "has_records", return_value=False) as has_records:
+                    self.assertTrue(pipeline.reader.input_port_a.can_retrieve())
+                    has_records.assert_not_called()
+
+            pipeline.writer.output_port.send(["0", "1", "2"])
+            for channel_writer in pipeline.writer.output_port._channel_writers:
+                channel_writer.stop_channel()
+            channel_reader.invoke_sync_status_update()
+
+            with self.subTest("finished output with records"):
+                self.assertTrue(pipeline.reader.input_port_a.can_retrieve())
+
+            self.assertEqual(["0", "1", "2"], pipeline.reader.input_port_a.retrieve())
+
+            with self.subTest("finished output without records"):
+                self.assertFalse(pipeline.reader.input_port_a.can_retrieve())
+        finally:
+            self.assertTrue(pipeline.reader.input_port_a._on_port_close())
+            self.assertTrue(pipeline.writer.output_port._on_port_close())
+
     def test_channel_input_port_without_parent_context(self):
         input_port: ChannelInputPort = TestChannelInputPort("input_port")
 
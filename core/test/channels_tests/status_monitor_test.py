@@ -246,6 +246,31 @@ class ChannelStatusMonitorTest(unittest.TestCase):
         self.assertEqual("channel1", channel_base.retrieve_connected_channel_unique_names(
             lambda flt: "channel" in flt.get_channel_unique_name()).pop())
 
+    def test_get_channel_count_with_valid_statuses_expect_success(self):
+        channel_base = TestChannel("testChannel", BlankPortPlugin("owner"), None)
+
+        for idx, status in enumerate([ChannelStatus.Opened, ChannelStatus.Closed, ChannelStatus.Closed]):
+            channel_base._status_map[f"channel{idx}"] = \
+                ChannelStatusMonitor(f"channel{idx}", "ownerName", None, channel_base._logger)
+            channel_base._status_map.get(f"channel{idx}").update(ChannelStatusMessage(channel_name=f"channel{idx}",
+                                                                                      channel_context_name="ownerName",
+                                                                                      status=status,
+                                                                                      payload=None,
+                                                                                      timestamp=1))
+
+        # (expected count, filter name, filter function, limit)
+        for expected, filter_name, filter_function, limit in [
+            (3, "all", None, None),
+            (2, "all", None, 2),
+            (1, "opened", lambda flt: flt.is_channel_opened(), None),
+            (2, "closed", lambda flt: flt.is_channel_closed(), None),
+            (1, "closed", lambda flt: flt.is_channel_closed(), 1),
+            (2, "closed", lambda flt: flt.is_channel_closed(), 5),
+            (0, "error", lambda flt: flt.is_channel_error(), None),
+        ]:
+            with self.subTest(filter=filter_name, limit=limit):
+                self.assertEqual(expected, channel_base.retrieve_connected_channel_count(filter_function, limit))
+
     def test_get_channel_names_if_with_valid_statuses_expect_success(self):
         channel_base = TestChannel("testChannel", BlankPortPlugin("owner"), None)
 
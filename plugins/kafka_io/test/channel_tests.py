@@ -51,14 +51,7 @@ class KafkaChannelTest(unittest.TestCase):
 
     @staticmethod
     def generate_records(record_count: int) -> list[dict]:
-        generated_records = list()
-
-        for idx in range(record_count):
-            generated_records.append({
-                "demoText": f"record_{idx}"
-            })
-
-        return generated_records
+        return [{"demoText": f"record_{idx}"} for idx in range(record_count)]
 
     @classmethod
     def setUpClass(cls) -> None:
@@ -15,22 +15,42 @@
 # =============================================================================
 import concurrent.futures
 import io
-from typing import TYPE_CHECKING, Optional, Any
+from collections import deque
+from typing import TYPE_CHECKING, Optional, Any, Callable
 
-from amqp import Connection, PreconditionFailed
+from amqp import PreconditionFailed
 from avro.io import DatumWriter, BinaryEncoder, AvroTypeException, DatumReader, BinaryDecoder
 from avro.schema import parse
 from avro_validator import Schema
 
 from pypz.plugins.rmq_io.utils import MessageConsumer, MessageProducer, is_queue_existing, \
     ReaderStatusQueueNameExtension, \
-    WriterStatusQueueNameExtension, MaxStatusMessageRetrieveCount, is_exchange_existing
+    WriterStatusQueueNameExtension, MaxStatusMessageRetrieveCount, is_exchange_existing, compile_record_encoder, \
+    are_resources_existing, AdminConnection
 from pypz.core.channels.io import ChannelWriter, ChannelReader
 
 if TYPE_CHECKING:
     from pypz.core.specs.plugin import InputPortPlugin, OutputPortPlugin
 
 
+MaxPendingPublishBatchCount = 4
+"""
+Max number of batches, which can be in flight in case of asynchronous publishing. Once
+reached, writing the next batch blocks until the oldest one is published.
+"""
+
+
+class _BufferWriter:
+    """
+    Minimal file-like adapter, which allows the Avro encoder to append to a bytearray.
+
+    :param buffer: the buffer to append to
+    """
+
+    def __init__(self, buffer: bytearray):
+        self.write = buffer.extend
+
+
 class RMQChannelWriter(ChannelWriter):
 
     def __init__(self, channel_name: str,
@@ -41,6 +61,16 @@ class RMQChannelWriter(ChannelWriter):
 
         self._context: 'OutputPortPlugin' = context
 
+        self._is_principal: bool = self._context.is_principal()
+        """
+        Cached principal flag of the context, which does not change for the lifetime of the channel
+        """
+
+        self._group_size: int = self._context.get_group_size()
+        """
+        Cached group size of the context, which does not change for the lifetime of the channel
+        """
+
         self._data_exchange_name: str = channel_name
         """
         Data goes through exchanges, a dedicated exchange with this name will be
@@ -62,6 +92,20 @@ class RMQChannelWriter(ChannelWriter):
         Name of the stream, which contains the writer status signals
         """
 
+        self._resources_verified: bool = False
+        """
+        Set, once the existence of the resources has been verified at opening, so
+        retrying the opening e.g., after a failed consumer creation does not probe
+        them again. It is reset on close, since the resources can be deleted
+        by other parties meanwhile.
+        """
+
+        self._admin_connection: AdminConnection = AdminConnection()
+        """
+        Connection for the administrative operations, which is reused across
+        the retries of the channel operations
+        """
+
         self._data_producer: Optional[MessageProducer] = None
         """
         Producer wrapper to produce data messages for the ChannelReaders
@@ -82,46 +126,136 @@ class RMQChannelWriter(ChannelWriter):
         Configuration parameter to specify the timeout for draining events from the status stream
         """
 
-        self._generic_datum_writer: Optional[DatumWriter] = None
+        self._config_publisher_confirms: bool = False
+        """
+        Configuration parameter to enable publisher confirms for the data messages. If enabled,
+        the confirmations are awaited once per written batch.
+        """
+
+        self._config_async_publish: bool = False
+        """
+        Configuration parameter to enable asynchronous publishing of the data messages. If
+        enabled, the publishing of a batch is done by a dedicated thread, while the next
+        batch can be already prepared.
+        """
+
+        self._publish_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        """
+        Single threaded executor to publish the batches in case of asynchronous publishing.
+        Notice that the executor of the channel is not used, since it is occupied by the
+        status message handling. A single worker guarantees the order of the batches.
+        """
+
+        self._pending_publishes: deque[concurrent.futures.Future] = deque()
+        """
+        Publishing of batches submitted, but not yet checked for completion
+        """
+
+        self._generic_datum_writer: Optional[DatumWriter] = \
+            DatumWriter(writers_schema=parse(self._context.get_schema())) \
+            if self._context.get_schema() is not None else None
         """
         This is the datum writer that converts generic records to byte data. It
         is only initialized, if schema is provided.
         """
 
+        self._record_encoder: Optional[Callable[[Any, bytearray], bool]] = \
+            compile_record_encoder(self._generic_datum_writer.writers_schema) \
+            if self._generic_datum_writer is not None else None
+        """
+        Encoder specialized to the schema. It is None, if the schema is not supported
+        by the specialization, in which case the generic datum writer is used.
+        """
+
+        self._validator_schema: Optional[Any] = None
+        """
+        Parsed schema of the avro_validator package. It is only used to provide
+        a more descriptive error, if a record does not comply with the schema,
+        hence it is parsed on first use.
+        """
+
+        self._record_writer: Callable[[list[Any]], None] = self._write_avro_records \
+            if self._generic_datum_writer is not None else self._write_raw_records
+        """
+        The schema cannot change for the lifetime of the channel, hence the record
+        writer method is selected once here instead of checking on every call.
+        """
+
     def _write_records(self, records: list[Any]) -> None:
-        if (self._generic_datum_writer is None) and (self._context.get_schema() is not None):
-            self._generic_datum_writer = DatumWriter(writers_schema=parse(self._context.get_schema()))
-
-        if self._generic_datum_writer is None:
-            """
-            If no schema provided, and therefore no Avro will be used,
-            then send the records as string.
-            """
-            for record in records:
-                self._data_producer.publish(message=record, exchange_name=self._data_exchange_name)
-        else:
-            converted_records = list()
-
-            """ Record preparation and sending is separated not to send any record from
-                the batch, if some records are not valid """
-            for record in records:
-                record_bytes = io.BytesIO()
-                encoder = BinaryEncoder(record_bytes)
+        self._record_writer(records)
+
+    def _write_raw_records(self, records: list[Any]) -> None:
+        """
+        If no schema provided, and therefore no Avro will be used,
+        then send the records as they are. The records are copied in case of
+        asynchronous publishing, since the caller may reuse the list.
+        """
+        self._submit_publish(records if self._publish_executor is None else list(records))
+
+    def _publish_batch(self, messages: list[Any]) -> None:
+        self._data_producer.publish_many(messages, exchange_name=self._data_exchange_name)
+
+    def _submit_publish(self, messages: list[Any]) -> None:
+        if self._publish_executor is None:
+            self._publish_batch(messages)
+            return
+
+        """ Completed publishes are checked to surface errors as early as possible,
+            while the number of pending batches is limited to bound the memory. """
+        while self._pending_publishes and \
+                (self._pending_publishes[0].done() or
+                 (MaxPendingPublishBatchCount <= len(self._pending_publishes))):
+            self._pending_publishes.popleft().result()
+
+        self._pending_publishes.append(self._publish_executor.submit(self._publish_batch, messages))
+
+    def _wait_for_pending_publishes(self) -> None:
+        """
+        Waits for all the pending publishes, even if some of them failed, so no
+        failure can go unnoticed. The first failure is re-raised afterwards.
+        """
+
+        first_error: Optional[BaseException] = None
+
+        while self._pending_publishes:
+            error = self._pending_publishes.popleft().exception()
+            if first_error is None:
+                first_error = error
+
+        if first_error is not None:
+            raise first_error
+
+    def _write_avro_records(self, records: list[Any]) -> None:
+        """ All the records of the batch are encoded into the same buffer and only
+            their boundaries are tracked, so there is only a single copy per record,
+            when it is sliced out for publishing. """
+        batch_buffer = bytearray()
+        encoder = BinaryEncoder(_BufferWriter(batch_buffer))
+        record_boundaries = list()
+
+        """ Record preparation and sending is separated not to send any record from
+            the batch, if some records are not valid """
+        for record in records:
+            record_start = len(batch_buffer)
 
+            if (self._record_encoder is None) or (not self._record_encoder(record, batch_buffer)):
                 try:
                     self._generic_datum_writer.write(record, encoder)
-                    converted_records.append(record_bytes.getvalue())
                 except AvroTypeException:
                     # This line is only executed, if there is an issue with the
                     # data w.r.t. the schema. The used package gives a better message
                     # what is the issue and where
                     self._logger.error(record)
-                    schema = Schema(self._context.get_schema())
-                    parsed_schema = schema.parse()
-                    parsed_schema.validate(record)
+                    if self._validator_schema is None:
+                        self._validator_schema = Schema(self._context.get_schema()).parse()
+                    self._validator_schema.validate(record)
+                    continue
 
-            for converted_record in converted_records:
-                self._data_producer.publish(message=converted_record, exchange_name=self._data_exchange_name)
+            record_boundaries.append((record_start, len(batch_buffer)))
+
+        with memoryview(batch_buffer) as batch_view:
+            self._submit_publish([bytes(batch_view[record_start:record_end])
+                                  for record_start, record_end in record_boundaries])
 
     def _create_resources(self) -> bool:
         return True
@@ -133,13 +267,16 @@ class RMQChannelWriter(ChannelWriter):
         if self.get_location() is None:
             raise ValueError(f"Missing channel location for channel: {self._channel_name}")
 
-        with Connection(host=self.get_location()) as admin_connection:
-            admin_channel = admin_connection.channel()
-            if not is_queue_existing(self._data_queue_name, admin_channel) or \
-                    not is_queue_existing(self._reader_status_stream_name, admin_channel) or \
-                    not is_queue_existing(self._writer_status_stream_name, admin_channel) or \
-                    not is_exchange_existing(self._data_exchange_name, exchange_type="", channel=admin_channel):
+        if not self._resources_verified:
+            admin_channel = self._admin_connection.channel(self.get_location())
+            if not are_resources_existing((self._data_queue_name,
+                                           self._reader_status_stream_name,
+                                           self._writer_status_stream_name),
+                                          channel=admin_channel,
+                                          exchange_name=self._data_exchange_name):
                 return False
+            self._resources_verified = True
+            self._admin_connection.close()
 
         if self._reader_status_consumer is None:
             try:
@@ -150,7 +287,7 @@ class RMQChannelWriter(ChannelWriter):
                 )
                 self._reader_status_consumer.subscribe(self._reader_status_stream_name,
                                                        arguments={"x-stream-offset": "first"})
-                if (1 < self._context.get_group_size()) and self._context.is_principal():
+                if (1 < self._group_size) and self._is_principal:
                     self._reader_status_consumer.subscribe(self._writer_status_stream_name,
                                                            arguments={"x-stream-offset": "first"})
             except PreconditionFailed as e:
@@ -160,26 +297,61 @@ class RMQChannelWriter(ChannelWriter):
                 raise
 
         if self._data_producer is None:
-            self._data_producer = MessageProducer(host=self.get_location())
+            self._data_producer = MessageProducer.acquire(self.get_location(),
+                                                          confirm_publish=self._config_publisher_confirms)
 
         if self._writer_status_producer is None:
-            self._writer_status_producer = MessageProducer(host=self.get_location())
+            self._writer_status_producer = MessageProducer.acquire(self.get_location())
+
+        if self._config_async_publish and (self._publish_executor is None):
+            self._publish_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{self._channel_name}-publisher"
+            )
 
         return True
 
     def can_close(self) -> bool:
         return True
 
+    def stop_channel(self, send_status_message: bool = True) -> None:
+        """ Pending batches shall be published before signalizing to the readers
+            that no more data is to be expected. """
+        self._wait_for_pending_publishes()
+        super().stop_channel(send_status_message)
+
     def _close_channel(self) -> bool:
-        if self._data_producer is not None:
-            self._data_producer.close()
-            self._data_producer = None
-        if self._writer_status_producer is not None:
-            self._writer_status_producer.close()
-            self._writer_status_producer = None
-        if self._reader_status_consumer is not None:
-            self._reader_status_consumer.close()
-            self._reader_status_consumer = None
+        self._resources_verified = False
+        self._admin_connection.close()
+
+        # A failure of the last batches in flight or of closing a resource e.g., a nack
+        # on the final flush of the data producer, is re-raised only after all the
+        # other resources have been released, so it cannot leak them.
+        close_error: Optional[Exception] = None
+
+        if self._publish_executor is not None:
+            try:
+                self._wait_for_pending_publishes()
+            except Exception as e:
+                close_error = e
+            finally:
+                self._publish_executor.shutdown()
+                self._publish_executor = None
+
+        resources = (self._data_producer, self._writer_status_producer, self._reader_status_consumer)
+        self._data_producer = None
+        self._writer_status_producer = None
+        self._reader_status_consumer = None
+
+        for resource in resources:
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception as e:
+                    if close_error is None:
+                        close_error = e
+
+        if close_error is not None:
+            raise close_error
 
         return True
 
@@ -187,6 +359,12 @@ class RMQChannelWriter(ChannelWriter):
         if "status_consumer_timeout_sec" in channel_configuration:
             self._config_status_consumer_timeout_sec = channel_configuration["status_consumer_timeout_sec"]
 
+        if "publisher_confirms" in channel_configuration:
+            self._config_publisher_confirms = channel_configuration["publisher_confirms"]
+
+        if "async_publish" in channel_configuration:
+            self._config_async_publish = channel_configuration["async_publish"]
+
     def _send_status_message(self, message: str) -> None:
         self._writer_status_producer.publish(message=message, queue_name=self._writer_status_stream_name)
 
@@ -213,25 +391,52 @@ class RMQChannelReader(ChannelReader):
 
         self._context: 'InputPortPlugin' = context
 
+        self._is_principal: bool = self._context.is_principal()
+        """
+        Cached principal flag of the context, which does not change for the lifetime of the channel
+        """
+
+        self._is_group: bool = self._context.is_in_group_mode()
+        """
+        Cached group mode flag of the context, which does not change for the lifetime of the channel
+        """
+
+        self._group_size: int = self._context.get_group_size()
+        """
+        Cached group size of the context, which does not change for the lifetime of the channel
+        """
+
+        self._group_name: Optional[str] = self._context.get_group_name()
+        """
+        Cached group name of the context, which does not change for the lifetime of the channel
+        """
+
         self._data_exchange_name: str = channel_name
         """
         Data goes through exchanges, a dedicated exchange with this name will be
         created for this channel.
         """
 
-        self._exchange_type = "direct" if not self._context.is_in_group_mode() else "fanout"
+        self._exchange_type = "direct" if not self._is_group else "fanout"
         """
         This controls, how the exchange shall forward messages to the consumers. In group
         mode, all the consumers shall get all the messages, hence we need to specify it as "fanout"
         """
 
         self._data_queue_name: str = channel_name \
-            if (not self._context.is_in_group_mode()) or (self._context.is_principal()) \
+            if (not self._is_group) or self._is_principal \
             else f"{channel_name}-{self._context.get_group_index()}"
         """
         Data queue name, where all the data messages go through
         """
 
+        self._data_queues: tuple[str, ...] = (channel_name,) + tuple(
+            f"{channel_name}-{idx}" for idx in range(1, self._group_size)
+        ) if self._is_group else (channel_name,)
+        """
+        Names of all the data queues of the channel. In group mode, each replica has its own queue.
+        """
+
         self._reader_status_stream_name: str = channel_name + ReaderStatusQueueNameExtension
         """
         Name of the stream, which contains the reader status signals
@@ -242,6 +447,20 @@ class RMQChannelReader(ChannelReader):
         Name of the stream, which contains the writer status signals
         """
 
+        self._resources_verified: bool = False
+        """
+        Set, once the existence of the resources has been verified at opening, so
+        retrying the opening e.g., after a failed consumer creation does not probe
+        them again. It is reset on close, since the resources can be deleted
+        by other parties meanwhile.
+        """
+
+        self._admin_connection: AdminConnection = AdminConnection()
+        """
+        Connection for the administrative operations, which is reused across
+        the retries of the channel operations
+        """
+
         self._data_consumer: Optional[MessageConsumer] = None
         """
         Consumer wrapper to consume data messages sent by the ChannelWriter
@@ -262,6 +481,19 @@ class RMQChannelReader(ChannelReader):
         Configuration parameter to specify the max number of messages to process in one go
         """
 
+        self._config_prefetch_count: Optional[int] = None
+        """
+        Configuration parameter to specify the max number of unacknowledged messages pushed
+        by the server to the data consumer. If not specified, max_poll_records is used.
+        """
+
+        self._config_max_prefetch_count: Optional[int] = None
+        """
+        Configuration parameter to specify the max value, up to which the prefetch count
+        is grown, if the reads consistently return max_poll_records messages. If not
+        specified, the prefetch count is not changed.
+        """
+
         self._config_data_consumer_timeout_sec: float = 0.1
         """
         Configuration parameter to specify the timeout for draining events from the data queue
@@ -272,12 +504,21 @@ class RMQChannelReader(ChannelReader):
         Configuration parameter to specify the timeout for draining events from the status stream
         """
 
-        self._generic_datum_reader: Optional[DatumReader] = None
+        self._generic_datum_reader: Optional[DatumReader] = \
+            DatumReader(parse(self._context.get_schema())) \
+            if self._context.get_schema() is not None else None
         """
         This is the generic datum reader, which converts bytes to generic records.
         It will be only initialized, if a schema is provided.
         """
 
+        self._record_reader: Callable[[], list[Any]] = self._read_avro_records \
+            if self._generic_datum_reader is not None else self._read_raw_records
+        """
+        The schema cannot change for the lifetime of the channel, hence the record
+        reader method is selected once here instead of checking on every call.
+        """
+
     def _load_input_record_offset(self) -> int:
         """
         Offset has no meaning in queues, nevertheless the value -1 is necessary,
@@ -286,7 +527,7 @@ class RMQChannelReader(ChannelReader):
         return -1
 
     def can_close(self) -> bool:
-        if (not self._context.is_principal()) or (self._context.get_group_name() is None):
+        if (not self._is_principal) or (self._group_name is None):
             return True
 
         self.invoke_sync_status_update()
@@ -294,32 +535,33 @@ class RMQChannelReader(ChannelReader):
         if 0 == self.retrieve_all_connected_channel_count():
             return True
 
-        finished_replica_count = len(self.retrieve_connected_channel_unique_names(
-            lambda flt: (flt.get_channel_group_name() == self._context.get_group_name()) and
-                        ((not flt.is_channel_healthy()) or flt.is_channel_stopped() or flt.is_channel_closed())
-        ))
+        finished_replica_count = self.retrieve_connected_channel_count(
+            lambda flt: (flt.get_channel_group_name() == self._group_name) and
+                        ((not flt.is_channel_healthy()) or flt.is_channel_stopped() or flt.is_channel_closed()),
+            limit=self._group_size - 1
+        )
 
-        return finished_replica_count == (self._context.get_group_size() - 1)
+        return finished_replica_count == (self._group_size - 1)
 
     def has_records(self) -> bool:
         return self._data_consumer.has_records()
 
     def _read_records(self) -> list[Any]:
-        if (self._generic_datum_reader is None) and (self._context.get_schema() is not None):
-            self._generic_datum_reader = DatumReader(parse(self._context.get_schema()))
+        return self._record_reader()
+
+    def _read_raw_records(self) -> list[Any]:
+        return self._data_consumer.poll(self._config_data_consumer_timeout_sec)
 
-        if self._generic_datum_reader is None:
-            return self._data_consumer.poll(self._config_data_consumer_timeout_sec)
-        else:
-            converted_records = []
+    def _read_avro_records(self) -> list[Any]:
+        converted_records = []
 
-            records = self._data_consumer.poll(self._config_data_consumer_timeout_sec)
+        records = self._data_consumer.poll(self._config_data_consumer_timeout_sec)
 
-            for record in records:
-                decoder = BinaryDecoder(io.BytesIO(record))
-                converted_records.append(self._generic_datum_reader.read(decoder))
+        for record in records:
+            decoder = BinaryDecoder(io.BytesIO(record))
+            converted_records.append(self._generic_datum_reader.read(decoder))
 
-            return converted_records
+        return converted_records
 
     def _commit_offset(self, offset: int) -> None:
         self._data_consumer.commit_messages()
@@ -328,21 +570,15 @@ class RMQChannelReader(ChannelReader):
         if self.get_location() is None:
             raise ValueError(f"Missing channel location for channel: {self._channel_name}")
 
-        with (Connection(host=self.get_location()) as admin_connection):
-            admin_channel = admin_connection.channel()
+        try:
+            admin_channel = self._admin_connection.channel(self.get_location())
 
             admin_channel.exchange_declare(
                 exchange=self._data_exchange_name, type=self._exchange_type,
                 passive=False, auto_delete=False, durable=True
             )
 
-            data_queues: list = [self._channel_name]
-
-            if self._context.is_in_group_mode():
-                data_queues.extend(
-                    [f"{self._channel_name}-{idx}" for idx in range(1, self._context.get_group_size())])
-
-            for data_queue in data_queues:
+            for data_queue in self._data_queues:
                 admin_channel.queue_declare(
                     data_queue, passive=False, durable=True, exclusive=False, auto_delete=False
                 )
@@ -358,22 +594,18 @@ class RMQChannelReader(ChannelReader):
                 passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
             )
 
-        return True
+            return True
+        finally:
+            self._admin_connection.close()
 
     def _delete_resources(self) -> bool:
         if self.get_location() is None:
             raise ValueError(f"Missing channel location for channel: {self._channel_name}")
 
-        with Connection(host=self.get_location()) as admin_connection:
-            admin_channel = admin_connection.channel()
-
-            data_queues: list = [self._channel_name]
+        try:
+            admin_channel = self._admin_connection.channel(self.get_location())
 
-            if self._context.is_in_group_mode():
-                data_queues.extend(
-                    [f"{self._channel_name}-{idx}" for idx in range(1, self._context.get_group_size())])
-
-            for data_queue in data_queues:
+            for data_queue in self._data_queues:
                 """ Note that although pypz has its own flow control, which makes sure that
                     no other channel uses the resources already at this point, glitch can
                     happen, which we shall signalize. The strategy is, if a resource is still
@@ -412,18 +644,23 @@ class RMQChannelReader(ChannelReader):
                 self._logger.error(f"Resources cannot be deleted, still used: {e}")
                 return False
 
-        return True
+            return True
+        finally:
+            self._admin_connection.close()
 
     def _open_channel(self) -> bool:
         if self.get_location() is None:
             raise ValueError(f"Missing channel location for channel: {self._channel_name}")
 
-        with Connection(host=self.get_location()) as admin_connection:
-            admin_channel = admin_connection.channel()
-            if not is_queue_existing(self._data_queue_name, admin_channel) or \
-                    not is_queue_existing(self._reader_status_stream_name, admin_channel) or \
-                    not is_queue_existing(self._writer_status_stream_name, admin_channel):
+        if not self._resources_verified:
+            admin_channel = self._admin_connection.channel(self.get_location())
+            if not are_resources_existing((self._data_queue_name,
+                                           self._reader_status_stream_name,
+                                           self._writer_status_stream_name),
+                                          channel=admin_channel):
                 return False
+            self._resources_verified = True
+            self._admin_connection.close()
 
         if self._writer_status_consumer is None:
             try:
@@ -434,7 +671,7 @@ class RMQChannelReader(ChannelReader):
                 )
                 self._writer_status_consumer.subscribe(self._writer_status_stream_name,
                                                        arguments={"x-stream-offset": "first"})
-                if (1 < self._context.get_group_size()) and self._context.is_principal():
+                if (1 < self._group_size) and self._is_principal:
                     self._writer_status_consumer.subscribe(self._reader_status_stream_name,
                                                            arguments={"x-stream-offset": "first"})
             except PreconditionFailed as e:
@@ -455,16 +692,21 @@ class RMQChannelReader(ChannelReader):
             self._data_consumer = MessageConsumer(
                 consumer_name="data-consumer",
                 max_poll_record=self._config_max_poll_records,
+                prefetch_count=self._config_prefetch_count,
+                max_prefetch_count=self._config_max_prefetch_count,
                 host=self.get_location()
             )
             self._data_consumer.subscribe(self._data_queue_name)
 
         if self._reader_status_producer is None:
-            self._reader_status_producer = MessageProducer(host=self.get_location())
+            self._reader_status_producer = MessageProducer.acquire(self.get_location())
 
         return True
 
     def _close_channel(self) -> bool:
+        self._resources_verified = False
+        self._admin_connection.close()
+
         if self._data_consumer is not None:
             self._data_consumer.close()
             self._data_consumer = None
@@ -481,6 +723,12 @@ class RMQChannelReader(ChannelReader):
         if "max_poll_records" in channel_configuration:
             self._config_max_poll_records = channel_configuration["max_poll_records"]
 
+        if "prefetch_count" in channel_configuration:
+            self._config_prefetch_count = channel_configuration["prefetch_count"]
+
+        if "max_prefetch_count" in channel_configuration:
+            self._config_max_prefetch_count = channel_configuration["max_prefetch_count"]
+
         if "data_consumer_timeout_sec" in channel_configuration:
             self._config_data_consumer_timeout_sec = channel_configuration["data_consumer_timeout_sec"]
 
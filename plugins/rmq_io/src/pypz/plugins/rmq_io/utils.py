@@ -13,14 +13,62 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # =============================================================================
-from queue import Queue
-from typing import Optional, Any
-
-from amqp import Connection, Channel, Message, NotFound
+import atexit
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from functools import partial
+from typing import Optional, Any, Callable, Iterable, cast
+
+from amqp import Connection, Channel, Message, NotFound, spec
+from amqp.exceptions import MessageNacked
 
 WriterStatusQueueNameExtension = ".writer.status"
 ReaderStatusQueueNameExtension = ".reader.status"
 MaxStatusMessageRetrieveCount = 100
+MaxPooledProducerCountPerHost = 8
+AvailableRecordCacheTimeSec = 0.05
+PrefetchGrowthFullPollCount = 3
+
+_AvroFloatStruct = struct.Struct("<f")
+_AvroDoubleStruct = struct.Struct("<d")
+
+_AvroPrimitiveTypeChecks = {
+    "null": "{value} is None",
+    "boolean": "type({value}) is bool",
+    "int": "(type({value}) is int) and (-2147483648 <= {value} <= 2147483647)",
+    "long": "(type({value}) is int) and (-9223372036854775808 <= {value} <= 9223372036854775807)",
+    "float": "type({value}) is float",
+    "double": "type({value}) is float",
+    "string": "type({value}) is str",
+    "bytes": "type({value}) is bytes",
+}
+"""
+Type checks of the specialized record encoder. These are intentionally at least as strict
+as the validation of the generic Avro DatumWriter, so every record accepted here would
+be accepted there as well, while everything else is left to the generic writer.
+"""
+
+_AvroPrimitiveWriters = {
+    "null": "",
+    "boolean": "buffer.append(1 if {value} else 0)",
+    "int": "_append_avro_long(buffer, {value})",
+    "long": "_append_avro_long(buffer, {value})",
+    "float": "buffer += _AvroFloatStruct.pack({value})",
+    "double": "buffer += _AvroDoubleStruct.pack({value})",
+    "string": "{value} = {value}.encode(); _append_avro_long(buffer, len({value})); buffer += {value}",
+    "bytes": "_append_avro_long(buffer, len({value})); buffer += {value}",
+}
+"""
+Source snippets of the specialized record encoder per primitive type. The encoder is
+generated and compiled from these instead of reusing the Avro DatumWriter, since the
+DatumWriter resolves the schema type, validates and dispatches to a write method for
+every field of every record, which dominates the cost of encoding small records.
+The generated source inlines all of these for the given schema, so the per-record
+cost is reduced to the type checks and the appends to the buffer.
+"""
 
 
 def is_queue_existing(queue_name: str, channel: Channel):
@@ -39,6 +87,145 @@ def is_exchange_existing(exchange_name: str, exchange_type: str, channel: Channe
         return False
 
 
+def are_resources_existing(queue_names: Iterable[str], channel: Channel,
+                           exchange_name: Optional[str] = None, exchange_type: str = "") -> bool:
+    """
+    Checks the existence of all the specified queues and optionally of the exchange. Unlike
+    calling is_queue_existing() per resource, the passive declarations are pipelined i.e.,
+    all but the last one are sent without waiting for the reply. If any of them fails, the
+    broker closes the channel, which is then reported on the reply of the last declaration,
+    hence checking all the resources costs a single round trip.
+
+    :param queue_names: names of the queues to check
+    :param channel: channel to use for the check
+    :param exchange_name: name of the exchange to check (nullable)
+    :param exchange_type: type of the exchange
+    :return: True, if all the resources exist, False otherwise
+    """
+
+    declarations = [partial(channel.queue_declare, queue=queue_name, passive=True) for queue_name in queue_names]
+
+    if exchange_name is not None:
+        declarations.append(partial(channel.exchange_declare, exchange=exchange_name,
+                                    type=exchange_type, passive=True))
+
+    try:
+        for declaration in declarations[:-1]:
+            declaration(nowait=True)
+        if declarations:
+            declarations[-1]()
+        return True
+    except NotFound:
+        return False
+
+
+def _append_avro_long(buffer: bytearray, value: int) -> None:
+    """
+    Appends the zig-zag and variable length encoded value as specified by Avro.
+    """
+    value = (value << 1) ^ (value >> 63)
+    while value & ~0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def compile_record_encoder(schema: Any) -> Optional[Callable[[Any, bytearray], bool]]:
+    """
+    Generates an encoder specialized to the provided Avro record schema, which writes
+    the fields in order without the generic per-field dispatch of the DatumWriter.
+    The returned function appends the encoded record to the provided buffer and
+    returns True. If the record does not pass the type checks, then nothing is
+    written and False is returned, so the caller can fall back to the generic
+    DatumWriter, which then produces the proper error. Only records with primitive
+    fields are supported, for every other schema None is returned.
+
+    :param schema: parsed Avro schema
+    :return: specialized encoder function or None, if the schema is not supported
+    """
+
+    schema_json = schema.to_json()
+
+    if (not isinstance(schema_json, dict)) or ("record" != schema_json.get("type")):
+        return None
+
+    field_names = []
+    checks = []
+    reads = []
+    writes = []
+
+    for idx, field in enumerate(schema_json["fields"]):
+        field_type = field["type"]
+        if (not isinstance(field_type, str)) or (field_type not in _AvroPrimitiveTypeChecks):
+            return None
+
+        value = f"value_{idx}"
+        field_names.append(field["name"])
+        reads.append(f"    {value} = record.get({field['name']!r})")
+        checks.append(f"({_AvroPrimitiveTypeChecks[field_type].format(value=value)})")
+        if _AvroPrimitiveWriters[field_type]:
+            writes.append(f"    {_AvroPrimitiveWriters[field_type].format(value=value)}")
+
+    source = "\n".join([
+        "def encode_record(record, buffer):",
+        "    if not ((type(record) is dict) and (record.keys() <= field_names)):",
+        "        return False",
+        *reads,
+        f"    if not ({' and '.join(checks) or 'True'}):",
+        "        return False",
+        *writes,
+        "    return True",
+    ])
+
+    namespace = {
+        "field_names": frozenset(field_names),
+        "_append_avro_long": _append_avro_long,
+        "_AvroFloatStruct": _AvroFloatStruct,
+        "_AvroDoubleStruct": _AvroDoubleStruct,
+    }
+    exec(compile(source, f"<avro encoder {schema_json.get('name')}>", "exec"), namespace)
+
+    return cast(Callable[[Any, bytearray], bool], namespace["encode_record"])
+
+
+class AdminConnection:
+    """
+    Lazily established connection for administrative operations like resource creation,
+    deletion and existence checks. It allows to reuse the same connection across the
+    retried invocations of such operations instead of establishing a new one each time.
+    Notice that it is not intended to be shared between threads.
+    """
+
+    def __init__(self):
+        self._connection: Optional[Connection] = None
+        self._channel: Optional[Channel] = None
+
+    def channel(self, host: str) -> Channel:
+        """
+        Returns the channel of the connection. The connection is established on the
+        first call or, if it has been lost meanwhile.
+
+        :param host: host of the broker
+        :return: channel for administrative operations
+        """
+
+        if (self._connection is None) or (not self._connection.connected):
+            self.close()
+            self._connection = Connection(host=host)
+            self._connection.connect()
+            self._channel = self._connection.channel()
+
+        return self._channel
+
+    def close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            finally:
+                self._connection = None
+                self._channel = None
+
+
 class _MessagingBase:
     def __init__(self,
                  connection: Optional[Connection] = None,
@@ -56,99 +243,514 @@ class _MessagingBase:
 
 
 class MessageConsumer(_MessagingBase):
-    def __init__(self, consumer_name: str, max_poll_record: Optional[int] = 1,
-                 connection: Optional[Connection] = None, *args, **kwargs):
+    def __init__(self, consumer_name: str, max_poll_record: Optional[int] = 100,
+                 connection: Optional[Connection] = None, *args,
+                 prefetch_count: Optional[int] = None,
+                 max_prefetch_count: Optional[int] = None,
+                 ack_every_n: Optional[int] = None, **kwargs):
         super().__init__(connection, *args, **kwargs)
 
-        self._channel.basic_qos(0, max_poll_record, False)
-        """ This setting is required to prevent memory overflow, since
-            without this setting, the server would push every new message
-            to the consumer regardless, how fast the consumer can process it,
-            the prefetch count defines the max number of messages pushed
-            by the server before requiring 'acknowledge' signal."""
+        self._prefetch_count: int = max_poll_record if prefetch_count is None else prefetch_count
+        """
+        Max number of unacknowledged messages pushed by the server. It defaults to the
+        max_poll_record, but it can be set higher to keep the server side window open,
+        while still returning smaller batches by poll(). Notice that a prefetch count
+        of 1 serializes the delivery by the round trip time of the acknowledgements.
+        """
+
+        self._initial_prefetch_count: int = self._prefetch_count
+
+        self._max_prefetch_count: Optional[int] = max_prefetch_count
+        """
+        If specified, the prefetch count is doubled up to this value, each time poll()
+        returned max_poll_record messages PrefetchGrowthFullPollCount times in a row,
+        and it is reset to its initial value by the first empty poll. It is disabled
+        by default, since the prefetched messages are not available for the other
+        consumers of the same queue. Notice that it bounds the memory held by the
+        consumer as well.
+        """
+
+        self._consecutive_full_poll_count: int = 0
+
+        self._qos_applied: bool = False
+        """
+        Set, once the prefetch count has been applied. It is applied at the first
+        subscription to spare the round trip for consumers, which never subscribe.
+        """
 
         self._max_poll_record: int = max_poll_record
 
-        self._subscriptions: set[str] = set()
+        self._subscriptions: dict[str, str] = dict()
+        """
+        Subscribed queue names mapped to the consumer tags used for them
+        """
+
+        self._subscription_arguments: dict[str, Any] = dict()
+        """
+        Subscribed queue names mapped to the arguments of the subscription, which
+        are required to recreate the subscriptions, if the prefetch count changes
+        """
+
+        self._is_subscribed: bool = False
+        """
+        Set, if there is at least one subscription. It is only updated on (un)subscribe.
+        """
 
         self._consumer_name: str = consumer_name
 
-        self._retrieved_data_messages: Queue = Queue()
+        self._retrieved_data_messages: deque[Message] = deque()
         """
         This list stores the messages pushed by the server. Its size shall never exceed
-        the max_poll_records configuration.
+        the max_poll_records configuration. Notice that the messages are pushed from
+        drain_events() on the polling thread, hence no synchronized queue is required.
         """
 
-    def _on_message_received(self, message: Message) -> None:
-        self._retrieved_data_messages.put(message)
+        self._last_delivery_tag: int = 0
+        """
+        Delivery tag of the last message returned by poll(). Since delivery tags are
+        increasing per channel, acknowledging it with the 'multiple' flag acknowledges
+        every message returned so far in a single frame.
+        """
+
+        self._acknowledged_delivery_tag: int = 0
+        """
+        Delivery tag of the last acknowledgement sent to prevent sending redundant ones
+        """
+
+        self._records_available_until: float = 0
+        """
+        Monotonic time until the last positive remote record count is considered valid
+        in has_records(). Only positive counts are cached, so new records are never
+        missed, while a stale positive answer costs only an empty poll.
+        """
+
+        self._ack_every_n: Optional[int] = ack_every_n
+        """
+        If specified, poll() acknowledges the returned messages by itself, if their number
+        reaches this value. Notice that in this case the messages are acknowledged before
+        being processed, hence it is disabled by default to keep the at-least-once delivery.
+        """
 
     def subscribe(self, queue_name: str, arguments: Any = None) -> None:
         if queue_name in self._subscriptions:
             raise AttributeError(f"Queue already subscribed: {queue_name}")
 
+        """ The buffer is registered directly as callback, which saves an additional
+            Python frame per delivered message. """
+        if not self._qos_applied:
+            self._channel.basic_qos(0, self._prefetch_count, False)
+            """ This setting is required to prevent memory overflow, since
+                without this setting, the server would push every new message
+                to the consumer regardless, how fast the consumer can process it,
+                the prefetch count defines the max number of messages pushed
+                by the server before requiring 'acknowledge' signal. Notice that
+                the prefetch is applied per consumer (global=False), which is
+                much cheaper for the server than the channel wide setting."""
+            self._qos_applied = True
+
+        consumer_tag = sys.intern(f"{self._consumer_name}-{queue_name}")
         self._channel.basic_consume(
-            queue_name, consumer_tag=f"{self._consumer_name}-{queue_name}",
-            callback=self._on_message_received,
+            queue_name, consumer_tag=consumer_tag,
+            callback=self._retrieved_data_messages.append,
             arguments=arguments
         )
-        self._subscriptions.add(queue_name)
+        self._subscriptions[queue_name] = consumer_tag
+        self._subscription_arguments[queue_name] = arguments
+        self._is_subscribed = True
 
     def unsubscribe(self, queue_name: str) -> None:
         if queue_name not in self._subscriptions:
             raise KeyError(f"Queue not subscribed: {queue_name}")
-        self._channel.basic_cancel(consumer_tag=f"{self._consumer_name}-{queue_name}")
+        self._channel.basic_cancel(consumer_tag=self._subscriptions.pop(queue_name))
+        del self._subscription_arguments[queue_name]
+        self._is_subscribed = 0 < len(self._subscriptions)
+
+    def _change_prefetch_count(self, prefetch_count: int) -> None:
+        """
+        Applies the new prefetch count. Since the per consumer prefetch count is
+        applied only to the consumers created after setting it, the existing
+        subscriptions are recreated with the same consumer tags. The messages
+        delivered in the meantime are kept in the buffer.
+
+        :param prefetch_count: the new prefetch count
+        """
+
+        self._channel.basic_qos(0, prefetch_count, False)
+        self._prefetch_count = prefetch_count
+
+        for queue_name, consumer_tag in self._subscriptions.items():
+            self._channel.basic_cancel(consumer_tag=consumer_tag)
+            self._channel.basic_consume(
+                queue_name, consumer_tag=consumer_tag,
+                callback=self._retrieved_data_messages.append,
+                arguments=self._subscription_arguments[queue_name]
+            )
 
     def has_records(self) -> bool:
-        if 0 == len(self._subscriptions):
+        if not self._is_subscribed:
             raise AttributeError("Missing queue subscription, call subscribe() first")
 
-        return (0 < self.get_available_record_count()) or (0 < self._retrieved_data_messages.qsize())
+        if 0 < len(self._retrieved_data_messages):
+            return True
+
+        if time.monotonic() < self._records_available_until:
+            return True
+
+        if 0 < self.get_available_record_count():
+            self._records_available_until = time.monotonic() + AvailableRecordCacheTimeSec
+            return True
+
+        return False
 
     def get_available_record_count(self) -> int:
-        if 0 == len(self._subscriptions):
+        if not self._is_subscribed:
             raise AttributeError("Missing queue subscription, call subscribe() first")
 
-        record_count = 0
+        if 1 == len(self._subscriptions):
+            return self._channel.queue_declare(next(iter(self._subscriptions)), passive=True).message_count
+
+        """ In case of multiple subscriptions, all the passive declarations are sent
+            first and the replies are collected afterwards, so the query costs a single
+            round trip instead of one per subscription. The replies arrive in the order
+            of the requests. """
         for queue in self._subscriptions:
-            queue_data = self._channel.queue_declare(queue, passive=True)
-            record_count += queue_data.message_count
+            self._channel.send_method(
+                spec.Queue.Declare, "BsbbbbbF", (0, queue, True, False, False, True, False, None)
+            )
+
+        record_count = 0
+        for _ in range(len(self._subscriptions)):
+            _, message_count, _ = self._channel.wait(spec.Queue.DeclareOk, returns_tuple=True)
+            record_count += message_count
 
         return record_count
 
     def poll(self, timeout: Optional[float] = 0) -> list[str | bytes]:
-        if 0 == len(self._subscriptions):
+        """
+        Returns the bodies of the retrieved messages as they were delivered, no copy
+        is made. Binary payloads are returned as bytes, while payloads published as
+        str (i.e., with utf-8 content encoding) are decoded once by the amqp library.
+        Callers requiring a specific type shall convert at the use site.
+
+        :param timeout: max time in seconds to wait for messages, None to wait until the batch is full
+        :return: list of message bodies
+        """
+        if not self._is_subscribed:
             raise AttributeError("Missing queue subscription, call subscribe() first")
 
+        """ Bound lookups are hoisted out of the loops, since these are executed
+            once per message (for streams drain_events() delivers exactly one). """
+        drain_events = self._connection.drain_events
+        buffered_messages = self._retrieved_data_messages
+        max_poll_record = self._max_poll_record
+
+        """ We need to acquire either the max number of messages or, if there
+            are no more messages, then the deadline will make sure to terminate
+            the loop. Notice that drain_events() will retrieve arbitrary number
+            of messages in one go instead of all available. """
+        monotonic = time.monotonic
+        deadline = None if timeout is None else monotonic() + timeout
+
         try:
-            """ We need to acquire either the max number of messages or, if there
-                are no more messages, then the timeout will make sure to terminate
-                the loop. Notice that drain_events() will retrieve arbitrary number
-                of messages in one go instead of all available. """
-            while self._max_poll_record > self._retrieved_data_messages.qsize():
-                self._connection.drain_events(timeout=timeout)
+            while max_poll_record > len(buffered_messages):
+                """ After the deadline, the messages already received by the socket
+                    are still drained, but without waiting for new ones. """
+                drain_events(timeout=None if deadline is None else max(deadline - monotonic(), 0))
         except TimeoutError:
-            """ After timeout expires, a TimeoutError is raised, which
-                is in our case a normal condition, therefor we ignore it. """
+            """ If there is no message until the deadline, a TimeoutError is raised,
+                which is in our case a normal condition, therefor we ignore it.
+                Notice that it is raised at most once per poll. """
             pass
 
-        retrieved_messages = []
-        while 0 < self._retrieved_data_messages.qsize():
-            message = self._retrieved_data_messages.get()
-            retrieved_messages.append(message.body)
-        return retrieved_messages
+        """ Notice that with a prefetch count higher than the max_poll_record,
+            more messages can be buffered than what is allowed to be returned. """
+        popleft = buffered_messages.popleft
+        retrieved_messages = [popleft() for _ in range(min(len(buffered_messages), max_poll_record))]
+
+        if retrieved_messages:
+            self._last_delivery_tag = retrieved_messages[-1].delivery_tag
+
+            if (self._ack_every_n is not None) and (self._ack_every_n <= len(retrieved_messages)):
+                self.commit_messages()
+
+        if self._max_prefetch_count is not None:
+            self._adapt_prefetch_count(len(retrieved_messages))
+
+        return [message.body for message in retrieved_messages]
+
+    def _adapt_prefetch_count(self, retrieved_message_count: int) -> None:
+        """
+        Grows the prefetch count, if poll() consistently returns full batches, which
+        signals that the server side window is too small, and resets it after the
+        consumer went idle. Notice that the max_poll_record is not changed to keep
+        the load distribution between the consumers of the same queue.
+
+        :param retrieved_message_count: number of messages returned by the last poll
+        """
+
+        if self._max_poll_record <= retrieved_message_count:
+            self._consecutive_full_poll_count += 1
+            if (PrefetchGrowthFullPollCount <= self._consecutive_full_poll_count) and \
+                    (self._prefetch_count < self._max_prefetch_count):
+                self._change_prefetch_count(min(self._prefetch_count * 2, self._max_prefetch_count))
+                self._consecutive_full_poll_count = 0
+        else:
+            self._consecutive_full_poll_count = 0
+            if (0 == retrieved_message_count) and (self._initial_prefetch_count < self._prefetch_count):
+                self._change_prefetch_count(self._initial_prefetch_count)
 
     def commit_messages(self):
-        if 0 == len(self._subscriptions):
+        if not self._is_subscribed:
             raise AttributeError("Missing queue subscription, call subscribe() first")
 
-        self._channel.basic_ack(delivery_tag=0, multiple=True)
+        if self._acknowledged_delivery_tag < self._last_delivery_tag:
+            self._channel.basic_ack(delivery_tag=self._last_delivery_tag, multiple=True)
+            self._acknowledged_delivery_tag = self._last_delivery_tag
 
 
 class MessageProducer(_MessagingBase):
-    def __init__(self, connection: Optional[Connection] = None, *args, **kwargs):
+    _pool: dict[tuple[str, bool], list['MessageProducer']] = dict()
+    """
+    Idle producers returned by their owners, keyed by the host they are connected to
+    and whether publisher confirms are enabled
+    """
+
+    _pool_lock: threading.Lock = threading.Lock()
+    """
+    Lock to guard the pool, since producers are acquired and released from different threads
+    """
+
+    def __init__(self, connection: Optional[Connection] = None, *args, confirm_publish: bool = False, **kwargs):
         super().__init__(connection, *args, **kwargs)
 
+        self._pool_key: Optional[tuple[str, bool]] = None
+        """
+        The key of the pool, to which the producer shall be returned on close. None, if
+        the producer was not acquired from the pool.
+        """
+
+        self._confirm_publish: bool = confirm_publish
+        """
+        If set, the channel is put into confirm mode. Notice that the confirmations
+        are not awaited per message, but all at once by calling flush().
+        """
+
+        self._published_count: int = 0
+        """
+        Number of messages published in confirm mode, which is the delivery tag
+        the broker will confirm last
+        """
+
+        self._confirmed_count: int = 0
+        """
+        Highest delivery tag confirmed by the broker
+        """
+
+        self._nacked: bool = False
+        """
+        Set, if the broker rejected any of the messages since the last flush()
+        """
+
+        if self._confirm_publish:
+            self._channel.events["basic_ack"].add(self._on_confirm)
+            self._channel.events["basic_nack"].add(self._on_reject)
+            self._channel.confirm_select()
+
+        self._text_message: Message = Message("")
+        """
+        Reused message for text bodies. It is kept separately from the binary one, since
+        the library sets the content encoding property on the first text publish.
+        """
+
+        self._binary_message: Message = Message(b"")
+        """
+        Reused message for binary bodies
+        """
+
+        self._publish_lock: threading.Lock = threading.Lock()
+        """
+        Status messages can be published from different threads, hence the reused
+        messages shall be guarded
+        """
+
+    @classmethod
+    def acquire(cls, host: str, confirm_publish: bool = False) -> 'MessageProducer':
+        """
+        Checks out an idle producer connected to the specified host from the pool
+        or creates a new one, if there is none. Closing the returned producer
+        returns it to the pool instead of closing its connection, so reopening
+        channels does not require a full AMQP reconnect.
+
+        :param host: host of the broker
+        :param confirm_publish: if set, the producer publishes in confirm mode
+        :return: producer connected to the host
+        """
+
+        pool_key = (host, confirm_publish)
+
+        with cls._pool_lock:
+            idle_producers = cls._pool.get(pool_key)
+            producer = idle_producers.pop() if idle_producers else None
+
+        while (producer is not None) and (not producer._is_alive()):
+            producer._close_connection()
+            with cls._pool_lock:
+                producer = idle_producers.pop() if idle_producers else None
+
+        if producer is None:
+            producer = cls(host=host, confirm_publish=confirm_publish)
+
+        producer._pool_key = pool_key
+        return producer
+
+    def _is_alive(self) -> bool:
+        """
+        Checks, whether the connection of an idle producer is still usable. The client
+        side flags alone are not sufficient, since without heartbeats they are not
+        updated, if the connection has been dropped, while the producer was idle.
+        Therefore, the socket is read without blocking, which fails on a connection
+        closed by the peer.
+
+        :return: True, if the producer can be reused, False otherwise
+        """
+
+        if (not self._connection.connected) or (not self._channel.is_open):
+            return False
+
+        try:
+            self._connection.drain_events(timeout=0)
+        except TimeoutError:
+            # Nothing to read, which is expected on an idle, but alive connection
+            return True
+        except Exception:
+            return False
+
+        # Some frames were received e.g., the broker closed the channel
+        return self._connection.connected and self._channel.is_open
+
+    def _close_connection(self) -> None:
+        try:
+            super().close()
+        except Exception:
+            # The broken connection is discarded anyway
+            pass
+
+    @classmethod
+    def drain_pool(cls) -> None:
+        """
+        Closes the connections of all the idle producers in the pool. It is registered
+        to be called at exit, but it can be called anytime, since the producers in use
+        are not affected.
+        """
+
+        with cls._pool_lock:
+            idle_producers = [producer for producers in cls._pool.values() for producer in producers]
+            cls._pool.clear()
+
+        for producer in idle_producers:
+            producer._close_connection()
+
+    def close(self) -> None:
+        """
+        Returns the producer to the pool, if it was acquired from there, otherwise closes
+        its connection. Producers with a lost connection or unconfirmed messages are
+        never returned to the pool.
+
+        :raises MessageNacked: if the broker rejected any of the messages since the last flush()
+        """
+
+        if self._pool_key is None:
+            super().close()
+            return
+
+        pool_key, self._pool_key = self._pool_key, None
+
+        try:
+            self.flush()
+        except Exception:
+            self._close_connection()
+            raise
+
+        if (not self._connection.connected) or (not self._channel.is_open):
+            self._close_connection()
+            return
+
+        with MessageProducer._pool_lock:
+            idle_producers = MessageProducer._pool.setdefault(pool_key, list())
+            if len(idle_producers) < MaxPooledProducerCountPerHost:
+                idle_producers.append(self)
+                return
+
+        super().close()
+
     def publish(self, message: str | bytes, queue_name: str = "", exchange_name: str = ""):
-        self._channel.basic_publish(
-            Message(message), mandatory=True, exchange=exchange_name, routing_key=queue_name
-        )
+        amqp_message = self._text_message if isinstance(message, str) else self._binary_message
+
+        with self._publish_lock:
+            amqp_message.body = message
+            self._channel.basic_publish(
+                amqp_message, mandatory=True, exchange=exchange_name, routing_key=queue_name
+            )
+            if self._confirm_publish:
+                self._published_count += 1
+
+    def publish_many(self, messages: Iterable[str | bytes], queue_name: str = "", exchange_name: str = "") -> None:
+        """
+        Publishes all the provided messages at once. Unlike calling publish() per message,
+        the lock and the method lookups are taken only once per batch. In confirm mode,
+        the confirmations are awaited once after all the messages have been sent.
+
+        :param messages: messages to publish
+        :param queue_name: name of the target queue
+        :param exchange_name: name of the target exchange
+        """
+
+        basic_publish = self._channel.basic_publish
+        text_message = self._text_message
+        binary_message = self._binary_message
+
+        with self._publish_lock:
+            published_count = 0
+            for message in messages:
+                amqp_message = text_message if isinstance(message, str) else binary_message
+                amqp_message.body = message
+                basic_publish(amqp_message, mandatory=True, exchange=exchange_name, routing_key=queue_name)
+                published_count += 1
+
+            if self._confirm_publish:
+                self._published_count += published_count
+
+        self.flush()
+
+    def _on_confirm(self, delivery_tag: int, multiple: bool) -> None:
+        self._confirmed_count = max(self._confirmed_count, delivery_tag)
+
+    def _on_reject(self, delivery_tag: int, multiple: bool) -> None:
+        self._confirmed_count = max(self._confirmed_count, delivery_tag)
+        self._nacked = True
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits, until the broker confirmed all the messages published so far. It has
+        no effect, if the producer is not in confirm mode. Notice that the messages
+        are published without waiting for the confirmation, hence calling this method
+        once per batch costs a single round trip instead of one per message.
+
+        :param timeout: max time in seconds to wait for a confirmation frame
+        :raises MessageNacked: if the broker rejected any of the messages
+        """
+
+        if not self._confirm_publish:
+            return
+
+        drain_events = self._connection.drain_events
+
+        while self._confirmed_count < self._published_count:
+            drain_events(timeout=timeout)
+
+        if self._nacked:
+            self._nacked = False
+            raise MessageNacked("Broker rejected published messages")
+
+
+atexit.register(MessageProducer.drain_pool)
@@ -13,35 +13,148 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # =============================================================================
+import concurrent.futures
+import logging
+import socket
+import threading
 import time
 import unittest
+import uuid
 from typing import Optional
+from unittest import mock
 
 from amqp import Connection, Message, Channel
+from amqp.exceptions import MessageNacked
 
 from pypz.plugins.rmq_io.utils import ReaderStatusQueueNameExtension, WriterStatusQueueNameExtension, \
     is_queue_existing, is_exchange_existing
 from pypz.core.channels.status import ChannelStatusMessage, ChannelStatus
 from pypz.core.specs.misc import BlankOutputPortPlugin, BlankInputPortPlugin, BlankOperator
+from pypz.core.specs.plugin import PortPlugin
 from pypz.plugins.rmq_io.channels import RMQChannelWriter, RMQChannelReader
 
 
-class RMQChannelTest(unittest.TestCase):
-    bootstrap_url = "localhost:5672"
+BOOTSTRAP_URL = "localhost:5672"
+
+logger = logging.getLogger(__name__)
+
+
+def is_broker_available() -> bool:
+    host, port = BOOTSTRAP_URL.split(":")
+    try:
+        with socket.create_connection((host, int(port)), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+BROKER_AVAILABLE = is_broker_available()
+
+
+class RMQChannelLocalTest(unittest.TestCase):
+    """
+    Tests of the client side behavior, which do not require a running broker
+    """
+
+    def test_channel_writer_open_without_location_expect_error(self):
+        channel_writer = RMQChannelWriter(channel_name="test_channel",
+                                          context=BlankOutputPortPlugin("writer"))
+        with self.assertRaises(ValueError):
+            channel_writer.invoke_open_channel()
+
+    def test_channel_writer_creation_with_non_record_schema_expect_ok(self):
+        channel_writer = RMQChannelWriter(channel_name="test_channel",
+                                          context=BlankOutputPortPlugin("writer", schema='"string"'))
+        self.assertIsNone(channel_writer._record_encoder)
+
+    def test_channel_writer_close_with_failed_async_publish_expect_error(self):
+        channel_writer = RMQChannelWriter(channel_name="test_channel",
+                                          context=BlankOutputPortPlugin("writer"))
+        publish_released = threading.Event()
+
+        def publish_many(messages, exchange_name):
+            publish_released.wait()
+            if ["first"] == messages:
+                raise ConnectionError("publish failed")
+
+        data_producer = mock.Mock()
+        data_producer.publish_many.side_effect = publish_many
+        channel_writer._data_producer = data_producer
+        channel_writer._publish_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
-    test_channel_name = "test_channel"
-    test_reader_status_queue_name = test_channel_name + ReaderStatusQueueNameExtension
-    test_writer_status_queue_name = test_channel_name + WriterStatusQueueNameExtension
+        # Both batches are in flight, when the channel is closed
+        channel_writer._write_records(["first"])
+        channel_writer._write_records(["second"])
+        publish_released.set()
+
+        with self.assertRaises(ConnectionError):
+            channel_writer._close_channel()
+
+        self.assertEqual(2, data_producer.publish_many.call_count)
+        data_producer.close.assert_called_once()
+        self.assertIsNone(channel_writer._publish_executor)
+        self.assertEqual(0, len(channel_writer._pending_publishes))
+
+    def test_channel_writer_close_with_nacked_data_producer_expect_error(self):
+        channel_writer = RMQChannelWriter(channel_name="test_channel",
+                                          context=BlankOutputPortPlugin("writer"))
+        data_producer = mock.Mock()
+        data_producer.close.side_effect = MessageNacked("Broker rejected published messages")
+        writer_status_producer = mock.Mock()
+        reader_status_consumer = mock.Mock()
+        channel_writer._data_producer = data_producer
+        channel_writer._writer_status_producer = writer_status_producer
+        channel_writer._reader_status_consumer = reader_status_consumer
+
+        with self.assertRaises(MessageNacked):
+            channel_writer._close_channel()
+
+        data_producer.close.assert_called_once()
+        writer_status_producer.close.assert_called_once()
+        reader_status_consumer.close.assert_called_once()
+        self.assertIsNone(channel_writer._data_producer)
+        self.assertIsNone(channel_writer._writer_status_producer)
+        self.assertIsNone(channel_writer._reader_status_consumer)
+
+        with self.subTest("retried close expect no repeated close"):
+            self.assertTrue(channel_writer._close_channel())
+            data_producer.close.assert_called_once()
+
+    def test_channel_reader_resource_creation_without_location_expect_error(self):
+        channel_reader = RMQChannelReader(channel_name="test_channel",
+                                          context=BlankInputPortPlugin("reader"))
+        with self.assertRaises(ValueError):
+            channel_reader.invoke_resource_creation()
+
+    def test_channel_reader_open_without_location_expect_error(self):
+        channel_reader = RMQChannelReader(channel_name="test_channel",
+                                          context=BlankInputPortPlugin("reader"))
+        with self.assertRaises(ValueError):
+            channel_reader.invoke_open_channel()
+
+
+@unittest.skipUnless(BROKER_AVAILABLE, f"RabbitMQ broker is not available at {BOOTSTRAP_URL}")
+class RMQChannelTest(unittest.TestCase):
+    bootstrap_url = BOOTSTRAP_URL
 
     connection: Optional[Connection] = None
 
     admin_channel: Optional[Channel] = None
 
+    producer_channel: Optional[Channel] = None
+
+    consumer_channel: Optional[Channel] = None
+
     @classmethod
     def setUpClass(cls):
-        cls.connection = Connection(host=RMQChannelTest.bootstrap_url)
+        # The connection is used from the test thread only, hence there is no need for heartbeats
+        cls.connection = Connection(host=RMQChannelTest.bootstrap_url, heartbeat=0)
         cls.connection.connect()
         cls.admin_channel = cls.connection.channel()
+        # Dedicated channel for the test messages, publisher confirms are intentionally
+        # not enabled on it, so the publishes do not wait for the broker
+        cls.producer_channel = cls.connection.channel()
+        cls.consumer_channel = cls.connection.channel()
 
     @classmethod
     def tearDownClass(cls):
@@ -49,67 +162,116 @@ class RMQChannelTest(unittest.TestCase):
         cls.connection.close()
 
     def setUp(self):
-        print(f"Start: {self._testMethodName}")
+        logger.debug("Start: %s", self._testMethodName)
+        # Unique names make the tests independent of each other and of the leftovers
+        # of aborted runs, so they can be executed in parallel as well
+        self.test_channel_name = f"test_channel_{uuid.uuid4().hex[:8]}"
+        self.test_reader_status_queue_name = self.test_channel_name + ReaderStatusQueueNameExtension
+        self.test_writer_status_queue_name = self.test_channel_name + WriterStatusQueueNameExtension
 
     def tearDown(self) -> None:
-        print(f"Cleanup: {self._testMethodName}")
-        self.admin_channel.queue_delete(RMQChannelTest.test_channel_name)
-        self.admin_channel.queue_delete(RMQChannelTest.test_reader_status_queue_name)
-        self.admin_channel.queue_delete(RMQChannelTest.test_writer_status_queue_name)
-        self.admin_channel.exchange_delete(RMQChannelTest.test_channel_name)
-        print(f"End: {self._testMethodName}")
-
-    def test_channel_writer_open_without_resources_expect_nok(self):
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer"))
-        channel_writer.set_location(RMQChannelTest.bootstrap_url)
-
-        self.assertFalse(channel_writer.invoke_open_channel())
-
+        logger.debug("Cleanup: %s", self._testMethodName)
+        # Only the last deletion waits for the reply, which implies that the previous ones are done
+        self.admin_channel.queue_delete(self.test_channel_name, nowait=True)
+        self.admin_channel.queue_delete(self.test_reader_status_queue_name, nowait=True)
+        self.admin_channel.queue_delete(self.test_writer_status_queue_name, nowait=True)
+        self.admin_channel.exchange_delete(self.test_channel_name)
+        logger.debug("End: %s", self._testMethodName)
+
+    def _declare_topology(self):
+        """
+        Declares the resources of the test channel i.e., the data queue, the status
+        streams and the exchange bound to the data queue. The declarations are sent
+        without waiting for the replies, only the final binding waits, which fails
+        as well, if any of the previous declarations failed.
+        """
         self.admin_channel.queue_declare(
-            RMQChannelTest.test_channel_name, passive=False, durable=True, exclusive=False, auto_delete=False
+            self.test_channel_name, passive=False, durable=True, exclusive=False, auto_delete=False, nowait=True
         )
-        self.assertFalse(channel_writer.invoke_open_channel())
-
         self.admin_channel.queue_declare(
-            RMQChannelTest.test_reader_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
+            self.test_reader_status_queue_name, passive=False, durable=True, exclusive=False, auto_delete=False,
+            arguments={"x-queue-type": "stream"}, nowait=True
         )
-        self.assertFalse(channel_writer.invoke_open_channel())
-
         self.admin_channel.queue_declare(
-            RMQChannelTest.test_writer_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
+            self.test_writer_status_queue_name, passive=False, durable=True, exclusive=False, auto_delete=False,
+            arguments={"x-queue-type": "stream"}, nowait=True
         )
-        self.assertFalse(channel_writer.invoke_open_channel())
+        self.admin_channel.exchange_declare(
+            exchange=self.test_channel_name, type="direct",
+            passive=False, auto_delete=False, durable=True, nowait=True
+        )
+        self.admin_channel.queue_bind(queue=self.test_channel_name, exchange=self.test_channel_name)
 
-    def test_channel_writer_open_without_location_expect_error(self):
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer"))
-        with self.assertRaises(ValueError):
-            channel_writer.invoke_open_channel()
+    def _publish_dummy_records(self, record_count: int):
+        """
+        Publishes the specified number of records to the data queue. Notice that
+        basic_publish() does not wait for any reply without publisher confirms,
+        hence the frames are streamed to the broker back-to-back.
+        """
+        basic_publish = self.producer_channel.basic_publish
+        for idx in range(record_count):
+            basic_publish(Message(f"dummy_{idx}"), routing_key=self.test_channel_name)
+
+    def _create_channel_writer(self, context: Optional[BlankOutputPortPlugin] = None) -> RMQChannelWriter:
+        channel_writer = RMQChannelWriter(channel_name=self.test_channel_name,
+                                          context=BlankOutputPortPlugin("writer") if context is None else context)
+        channel_writer.set_location(self.bootstrap_url)
+        return channel_writer
+
+    def _create_channel_reader(self, context: Optional[BlankInputPortPlugin] = None) -> RMQChannelReader:
+        channel_reader = RMQChannelReader(channel_name=self.test_channel_name,
+                                          context=BlankInputPortPlugin("reader") if context is None else context)
+        channel_reader.set_location(self.bootstrap_url)
+        return channel_reader
+
+    def _publish_status_message(self, stream_name: str, channel_context: str | PortPlugin, status: ChannelStatus):
+        # The message is created on each call, since it carries its creation timestamp,
+        # which is evaluated by the health check
+        if isinstance(channel_context, str):
+            status_message = ChannelStatusMessage(
+                channel_name=self.test_channel_name,
+                channel_context_name=channel_context,
+                status=status
+            )
+        else:
+            status_message = ChannelStatusMessage(
+                channel_name=self.test_channel_name,
+                channel_context_name=channel_context.get_full_name(),
+                channel_group_name=channel_context.get_group_name(),
+                channel_group_index=channel_context.get_group_index(),
+                status=status
+            )
+
+        self.producer_channel.basic_publish(Message(str(status_message)), routing_key=stream_name)
+
+    def test_channel_writer_open_without_resources_expect_nok(self):
+        channel_writer = self._create_channel_writer()
+
+        # The resources are declared incrementally, while the exchange is always missing,
+        # so each stage reuses the resources declared by the previous ones
+        for stage, declare_resource in [
+            ("no resources", None),
+            ("data queue", lambda: self.admin_channel.queue_declare(
+                self.test_channel_name, passive=False, durable=True, exclusive=False, auto_delete=False
+            )),
+            ("reader status stream", lambda: self.admin_channel.queue_declare(
+                self.test_reader_status_queue_name,
+                passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
+            )),
+            ("writer status stream", lambda: self.admin_channel.queue_declare(
+                self.test_writer_status_queue_name,
+                passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
+            )),
+        ]:
+            with self.subTest(stage=stage):
+                if declare_resource is not None:
+                    declare_resource()
+                self.assertFalse(channel_writer.invoke_open_channel())
 
     def test_channel_writer_open_close_with_resources_expect_ok(self):
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer"))
-        channel_writer.set_location(RMQChannelTest.bootstrap_url)
+        channel_writer = self._create_channel_writer()
 
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_channel_name, passive=False, durable=True, exclusive=False, auto_delete=False
-        )
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_reader_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
-        )
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_writer_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
-        )
-        self.admin_channel.exchange_declare(
-            exchange=RMQChannelTest.test_channel_name, type="direct",
-            passive=False, auto_delete=False, durable=True
-        )
-        self.admin_channel.queue_bind(queue=RMQChannelTest.test_channel_name, exchange=RMQChannelTest.test_channel_name)
+        self._declare_topology()
 
         try:
             self.assertTrue(channel_writer.invoke_open_channel())
@@ -117,32 +279,30 @@ class RMQChannelTest(unittest.TestCase):
             self.assertTrue(channel_writer.invoke_close_channel())
 
     def test_channel_writer_open_close_with_invalid_resources_expect_error(self):
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer"))
-        channel_writer.set_location(RMQChannelTest.bootstrap_url)
+        channel_writer = self._create_channel_writer()
 
         self.admin_channel.queue_declare(
-            RMQChannelTest.test_channel_name, passive=False, durable=True, exclusive=False, auto_delete=False
+            self.test_channel_name, passive=False, durable=True, exclusive=False, auto_delete=False
         )
         self.assertFalse(channel_writer.invoke_open_channel())
 
         self.admin_channel.queue_declare(
-            RMQChannelTest.test_reader_status_queue_name,
+            self.test_reader_status_queue_name,
             passive=False, durable=True, exclusive=False, auto_delete=False,
         )
         self.assertFalse(channel_writer.invoke_open_channel())
 
         self.admin_channel.queue_declare(
-            RMQChannelTest.test_writer_status_queue_name,
+            self.test_writer_status_queue_name,
             passive=False, durable=True, exclusive=False, auto_delete=False,
         )
         self.assertFalse(channel_writer.invoke_open_channel())
 
         self.admin_channel.exchange_declare(
-            exchange=RMQChannelTest.test_channel_name, type="direct",
+            exchange=self.test_channel_name, type="direct",
             passive=False, auto_delete=False, durable=True
         )
-        self.admin_channel.queue_bind(queue=RMQChannelTest.test_channel_name, exchange=RMQChannelTest.test_channel_name)
+        self.admin_channel.queue_bind(queue=self.test_channel_name, exchange=self.test_channel_name)
 
         with self.assertRaises(ConnectionError):
             channel_writer.invoke_open_channel()
@@ -150,27 +310,9 @@ class RMQChannelTest(unittest.TestCase):
         self.assertTrue(channel_writer.invoke_close_channel())
 
     def test_channel_writer_publish_messages_expect_ok(self):
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer"))
-        channel_writer.set_location(RMQChannelTest.bootstrap_url)
+        channel_writer = self._create_channel_writer()
 
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_channel_name, passive=False, durable=True, exclusive=False, auto_delete=False
-        )
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_reader_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
-        )
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_writer_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
-        )
-
-        self.admin_channel.exchange_declare(
-            exchange=RMQChannelTest.test_channel_name, type="direct",
-            passive=False, auto_delete=False, durable=True
-        )
-        self.admin_channel.queue_bind(queue=RMQChannelTest.test_channel_name, exchange=RMQChannelTest.test_channel_name)
+        self._declare_topology()
 
         try:
             self.assertTrue(channel_writer.invoke_open_channel())
@@ -178,50 +320,33 @@ class RMQChannelTest(unittest.TestCase):
             test_messages = ["record_0", "record_1", "record_2"]
             channel_writer.invoke_write_records(test_messages)
 
-            time.sleep(2)
-
-            for message in test_messages:
-                pushed_message = self.admin_channel.basic_get(RMQChannelTest.test_channel_name)
-                self.assertIsNotNone(pushed_message)
-                self.assertEqual(message, pushed_message.body)
+            # The messages are pushed by the broker as they arrive instead of fetching them one by one
+            pushed_messages = []
+            consumer_tag = self.consumer_channel.basic_consume(self.test_channel_name,
+                                                               callback=pushed_messages.append, no_ack=True)
+            deadline = time.monotonic() + 2
+            try:
+                while (len(pushed_messages) < len(test_messages)) and (time.monotonic() < deadline):
+                    self.connection.drain_events(timeout=deadline - time.monotonic())
+            except TimeoutError:
+                pass
+            finally:
+                self.consumer_channel.basic_cancel(consumer_tag)
+
+            self.assertEqual(test_messages, [pushed_message.body for pushed_message in pushed_messages])
 
         finally:
             self.assertTrue(channel_writer.invoke_close_channel())
 
     def test_channel_writer_retrieve_status_message_with_single_connected_channel_expect_ok(self):
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer"))
-        channel_writer.set_location(RMQChannelTest.bootstrap_url)
+        channel_writer = self._create_channel_writer()
 
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_channel_name, passive=False, durable=True, exclusive=False, auto_delete=False
-        )
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_reader_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
-        )
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_writer_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
-        )
-
-        self.admin_channel.exchange_declare(
-            exchange=RMQChannelTest.test_channel_name, type="direct",
-            passive=False, auto_delete=False, durable=True
-        )
-        self.admin_channel.queue_bind(queue=RMQChannelTest.test_channel_name, exchange=RMQChannelTest.test_channel_name)
+        self._declare_topology()
 
         try:
             self.assertTrue(channel_writer.invoke_open_channel())
 
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name="reader",
-                        status=ChannelStatus.Opened
-                    )
-                )), routing_key=RMQChannelTest.test_reader_status_queue_name)
+            self._publish_status_message(self.test_reader_status_queue_name, "reader", ChannelStatus.Opened)
 
             channel_writer.invoke_sync_status_update()
 
@@ -230,16 +355,9 @@ class RMQChannelTest(unittest.TestCase):
                 lambda flt: flt.is_channel_opened()
             )
             self.assertEqual(1, len(connected_open_channel_count))
-            self.assertEqual(f"{RMQChannelTest.test_channel_name}@reader", connected_open_channel_count.pop())
+            self.assertEqual(f"{self.test_channel_name}@reader", connected_open_channel_count.pop())
 
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name="reader",
-                        status=ChannelStatus.Closed
-                    )
-                )), routing_key=RMQChannelTest.test_reader_status_queue_name)
+            self._publish_status_message(self.test_reader_status_queue_name, "reader", ChannelStatus.Closed)
 
             channel_writer.invoke_sync_status_update()
 
@@ -252,53 +370,21 @@ class RMQChannelTest(unittest.TestCase):
             )
             self.assertEqual(0, len(connected_open_channel_count))
             self.assertEqual(1, len(connected_closed_channel_count))
-            self.assertEqual(f"{RMQChannelTest.test_channel_name}@reader", connected_closed_channel_count.pop())
+            self.assertEqual(f"{self.test_channel_name}@reader", connected_closed_channel_count.pop())
         finally:
             self.assertTrue(channel_writer.invoke_close_channel())
 
     def test_channel_writer_retrieve_status_message_with_multi_connected_channel_expect_ok(self):
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer"))
-        channel_writer.set_location(RMQChannelTest.bootstrap_url)
-
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_channel_name, passive=False, durable=True, exclusive=False, auto_delete=False
-        )
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_reader_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
-        )
-        self.admin_channel.queue_declare(
-            RMQChannelTest.test_writer_status_queue_name,
-            passive=False, durable=True, exclusive=False, auto_delete=False, arguments={"x-queue-type": "stream"}
-        )
+        channel_writer = self._create_channel_writer()
 
-        self.admin_channel.exchange_declare(
-            exchange=RMQChannelTest.test_channel_name, type="direct",
-            passive=False, auto_delete=False, durable=True
-        )
-        self.admin_channel.queue_bind(queue=RMQChannelTest.test_channel_name, exchange=RMQChannelTest.test_channel_name)
+        self._declare_topology()
 
         try:
             self.assertTrue(channel_writer.invoke_open_channel())
 
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name="reader",
-                        status=ChannelStatus.Opened
-                    )
-                )), routing_key=RMQChannelTest.test_reader_status_queue_name)
-
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name="reader_0",
-                        status=ChannelStatus.Opened
-                    )
-                )), routing_key=RMQChannelTest.test_reader_status_queue_name)
+            self._publish_status_message(self.test_reader_status_queue_name, "reader", ChannelStatus.Opened)
+
+            self._publish_status_message(self.test_reader_status_queue_name, "reader_0", ChannelStatus.Opened)
 
             channel_writer.invoke_sync_status_update()
 
@@ -307,151 +393,117 @@ class RMQChannelTest(unittest.TestCase):
                 lambda flt: flt.is_channel_opened()
             )
             self.assertEqual(2, len(connected_open_channel_count))
-            self.assertIn(f"{RMQChannelTest.test_channel_name}@reader", connected_open_channel_count)
-            self.assertIn(f"{RMQChannelTest.test_channel_name}@reader_0", connected_open_channel_count)
+            self.assertIn(f"{self.test_channel_name}@reader", connected_open_channel_count)
+            self.assertIn(f"{self.test_channel_name}@reader_0", connected_open_channel_count)
         finally:
             self.assertTrue(channel_writer.invoke_close_channel())
 
-    def test_channel_reader_resource_creation_without_location_expect_error(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        with self.assertRaises(ValueError):
-            channel_reader.invoke_resource_creation()
-
     def test_channel_reader_resource_creation_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         self.assertTrue(channel_reader.invoke_resource_creation())
 
-        self.assertTrue(is_queue_existing(RMQChannelTest.test_channel_name, self.admin_channel))
-        self.assertTrue(is_queue_existing(RMQChannelTest.test_reader_status_queue_name, self.admin_channel))
-        self.assertTrue(is_queue_existing(RMQChannelTest.test_writer_status_queue_name, self.admin_channel))
-        self.assertTrue(is_exchange_existing(RMQChannelTest.test_channel_name, "", self.admin_channel))
+        self.assertTrue(is_queue_existing(self.test_channel_name, self.admin_channel))
+        self.assertTrue(is_queue_existing(self.test_reader_status_queue_name, self.admin_channel))
+        self.assertTrue(is_queue_existing(self.test_writer_status_queue_name, self.admin_channel))
+        self.assertTrue(is_exchange_existing(self.test_channel_name, "", self.admin_channel))
 
     def test_channel_reader_resource_creation_in_group_mode_expect_ok(self):
         operator_context = BlankOperator("blank")
         operator_context.set_parameter("replicationFactor", 2)
         plugin_context = BlankInputPortPlugin("reader", group_mode=True, context=operator_context)
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=plugin_context)
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader(plugin_context)
         self.assertTrue(channel_reader.invoke_resource_creation())
 
         try:
-            self.assertTrue(is_queue_existing(RMQChannelTest.test_channel_name, self.admin_channel))
-            self.assertTrue(is_queue_existing(RMQChannelTest.test_channel_name + "-1", self.admin_channel))
-            self.assertTrue(is_queue_existing(RMQChannelTest.test_channel_name + "-2", self.admin_channel))
-            self.assertTrue(is_queue_existing(RMQChannelTest.test_reader_status_queue_name, self.admin_channel))
-            self.assertTrue(is_queue_existing(RMQChannelTest.test_writer_status_queue_name, self.admin_channel))
-            self.assertTrue(is_exchange_existing(RMQChannelTest.test_channel_name, "", self.admin_channel))
+            self.assertTrue(is_queue_existing(self.test_channel_name, self.admin_channel))
+            self.assertTrue(is_queue_existing(self.test_channel_name + "-1", self.admin_channel))
+            self.assertTrue(is_queue_existing(self.test_channel_name + "-2", self.admin_channel))
+            self.assertTrue(is_queue_existing(self.test_reader_status_queue_name, self.admin_channel))
+            self.assertTrue(is_queue_existing(self.test_writer_status_queue_name, self.admin_channel))
+            self.assertTrue(is_exchange_existing(self.test_channel_name, "", self.admin_channel))
         finally:
-            self.admin_channel.queue_delete(RMQChannelTest.test_channel_name + "-1")
-            self.admin_channel.queue_delete(RMQChannelTest.test_channel_name + "-2")
+            self.admin_channel.queue_delete(self.test_channel_name + "-1")
+            self.admin_channel.queue_delete(self.test_channel_name + "-2")
 
     def test_channel_reader_resource_creation_idempotence(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         self.assertTrue(channel_reader.invoke_resource_creation())
         self.assertTrue(channel_reader.invoke_resource_creation())
 
     def test_channel_reader_resource_deletion_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         self.assertTrue(channel_reader.invoke_resource_creation())
         self.assertTrue(channel_reader.invoke_resource_deletion())
 
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_channel_name, self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_reader_status_queue_name, self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_writer_status_queue_name, self.admin_channel))
-        self.assertFalse(is_exchange_existing(RMQChannelTest.test_channel_name, "", self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_channel_name, self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_reader_status_queue_name, self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_writer_status_queue_name, self.admin_channel))
+        self.assertFalse(is_exchange_existing(self.test_channel_name, "", self.admin_channel))
 
     def test_channel_reader_resource_deletion_in_group_mode_expect_ok(self):
         operator_context = BlankOperator("blank")
         operator_context.set_parameter("replicationFactor", 2)
         plugin_context = BlankInputPortPlugin("reader", group_mode=True, context=operator_context)
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=plugin_context)
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader(plugin_context)
         self.assertTrue(channel_reader.invoke_resource_creation())
         self.assertTrue(channel_reader.invoke_resource_deletion())
 
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_channel_name, self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_channel_name + "-1", self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_channel_name + "-2", self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_reader_status_queue_name, self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_writer_status_queue_name, self.admin_channel))
-        self.assertFalse(is_exchange_existing(RMQChannelTest.test_channel_name, "", self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_channel_name, self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_channel_name + "-1", self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_channel_name + "-2", self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_reader_status_queue_name, self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_writer_status_queue_name, self.admin_channel))
+        self.assertFalse(is_exchange_existing(self.test_channel_name, "", self.admin_channel))
 
     def test_channel_reader_resource_deletion_with_active_consumer_expect_nok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         self.assertTrue(channel_reader.invoke_resource_creation())
 
-        self.admin_channel.basic_consume(RMQChannelTest.test_channel_name,
-                                         callback=lambda: None, consumer_tag="test-consumer")
+        self.consumer_channel.basic_consume(self.test_channel_name,
+                                            callback=lambda: None, consumer_tag="test-consumer")
         self.assertFalse(channel_reader.invoke_resource_deletion())
-        self.assertTrue(is_queue_existing(RMQChannelTest.test_channel_name, self.admin_channel))
-        self.assertTrue(is_queue_existing(RMQChannelTest.test_reader_status_queue_name, self.admin_channel))
-        self.assertTrue(is_queue_existing(RMQChannelTest.test_writer_status_queue_name, self.admin_channel))
-        self.assertTrue(is_exchange_existing(RMQChannelTest.test_channel_name, "", self.admin_channel))
+        self.assertTrue(is_queue_existing(self.test_channel_name, self.admin_channel))
+        self.assertTrue(is_queue_existing(self.test_reader_status_queue_name, self.admin_channel))
+        self.assertTrue(is_queue_existing(self.test_writer_status_queue_name, self.admin_channel))
+        self.assertTrue(is_exchange_existing(self.test_channel_name, "", self.admin_channel))
 
-        self.admin_channel.basic_cancel(consumer_tag="test-consumer")
+        self.consumer_channel.basic_cancel(consumer_tag="test-consumer")
         self.assertTrue(channel_reader.invoke_resource_deletion())
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_channel_name, self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_reader_status_queue_name, self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_writer_status_queue_name, self.admin_channel))
-        self.assertFalse(is_exchange_existing(RMQChannelTest.test_channel_name, "", self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_channel_name, self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_reader_status_queue_name, self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_writer_status_queue_name, self.admin_channel))
+        self.assertFalse(is_exchange_existing(self.test_channel_name, "", self.admin_channel))
 
     def test_channel_reader_resource_deletion_if_non_empty_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         self.assertTrue(channel_reader.invoke_resource_creation())
 
-        self.admin_channel.basic_publish(Message(str("dummy")), routing_key=RMQChannelTest.test_channel_name)
+        self.producer_channel.basic_publish(Message("dummy"), routing_key=self.test_channel_name)
         self.assertTrue(channel_reader.invoke_resource_deletion())
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_channel_name, self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_reader_status_queue_name, self.admin_channel))
-        self.assertFalse(is_queue_existing(RMQChannelTest.test_writer_status_queue_name, self.admin_channel))
-        self.assertFalse(is_exchange_existing(RMQChannelTest.test_channel_name, "", self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_channel_name, self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_reader_status_queue_name, self.admin_channel))
+        self.assertFalse(is_queue_existing(self.test_writer_status_queue_name, self.admin_channel))
+        self.assertFalse(is_exchange_existing(self.test_channel_name, "", self.admin_channel))
 
     def test_channel_reader_resource_deletion_idempotence(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         self.assertTrue(channel_reader.invoke_resource_creation())
         self.assertTrue(channel_reader.invoke_resource_deletion())
         self.assertTrue(channel_reader.invoke_resource_deletion())
 
     def test_channel_reader_open_without_resources_expect_nok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         self.assertFalse(channel_reader.invoke_open_channel())
 
-    def test_channel_reader_open_without_location_expect_error(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        with self.assertRaises(ValueError):
-            channel_reader.invoke_open_channel()
-
     def test_channel_reader_open_close_with_resources_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         self.assertTrue(channel_reader.invoke_resource_creation())
         self.assertTrue(channel_reader.invoke_open_channel())
         self.assertTrue(channel_reader.invoke_close_channel())
         self.assertTrue(channel_reader.invoke_resource_deletion())
 
     def test_channel_reader_open_close_idempotence(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         self.assertTrue(channel_reader.invoke_resource_creation())
         self.assertTrue(channel_reader.invoke_open_channel())
         self.assertTrue(channel_reader.invoke_open_channel())
@@ -460,47 +512,43 @@ class RMQChannelTest(unittest.TestCase):
         self.assertTrue(channel_reader.invoke_resource_deletion())
 
     def test_channel_reader_retrieve_without_commit_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
             self.assertTrue(channel_reader.invoke_open_channel())
             retrieved = channel_reader.invoke_read_records()
             self.assertEqual(0, len(retrieved))
-            self.admin_channel.basic_publish(Message(str("dummy_0")), routing_key=RMQChannelTest.test_channel_name)
+            self.producer_channel.basic_publish(Message("dummy_0"), routing_key=self.test_channel_name)
             retrieved = channel_reader.invoke_read_records()
             self.assertEqual(1, len(retrieved))
             self.assertEqual("dummy_0", retrieved[0])
-            self.admin_channel.basic_publish(Message(str("dummy_1")), routing_key=RMQChannelTest.test_channel_name)
-            self.admin_channel.basic_publish(Message(str("dummy_2")), routing_key=RMQChannelTest.test_channel_name)
+            self.producer_channel.basic_publish(Message("dummy_1"), routing_key=self.test_channel_name)
+            self.producer_channel.basic_publish(Message("dummy_2"), routing_key=self.test_channel_name)
             retrieved = channel_reader.invoke_read_records()
             self.assertEqual("dummy_1", retrieved[0])
             self.assertEqual("dummy_2", retrieved[1])
             self.assertEqual(2, len(retrieved))
         finally:
             self.assertTrue(channel_reader.invoke_close_channel())
-            self.assertEqual(3, self.admin_channel.queue_declare(RMQChannelTest.test_channel_name,
+            self.assertEqual(3, self.admin_channel.queue_declare(self.test_channel_name,
                                                                  passive=True).message_count)
             self.assertTrue(channel_reader.invoke_resource_deletion())
 
     def test_channel_reader_retrieve_with_commit_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
             self.assertTrue(channel_reader.invoke_open_channel())
             retrieved = channel_reader.invoke_read_records()
             self.assertEqual(0, len(retrieved))
-            self.admin_channel.basic_publish(Message(str("dummy_0")), routing_key=RMQChannelTest.test_channel_name)
+            self.producer_channel.basic_publish(Message("dummy_0"), routing_key=self.test_channel_name)
             retrieved = channel_reader.invoke_read_records()
             self.assertEqual(1, len(retrieved))
             self.assertEqual("dummy_0", retrieved[0])
-            self.admin_channel.basic_publish(Message(str("dummy_1")), routing_key=RMQChannelTest.test_channel_name)
-            self.admin_channel.basic_publish(Message(str("dummy_2")), routing_key=RMQChannelTest.test_channel_name)
+            self.producer_channel.basic_publish(Message("dummy_1"), routing_key=self.test_channel_name)
+            self.producer_channel.basic_publish(Message("dummy_2"), routing_key=self.test_channel_name)
             retrieved = channel_reader.invoke_read_records()
             self.assertEqual("dummy_1", retrieved[0])
             self.assertEqual("dummy_2", retrieved[1])
@@ -508,31 +556,25 @@ class RMQChannelTest(unittest.TestCase):
             channel_reader.invoke_commit_current_read_offset()
         finally:
             self.assertTrue(channel_reader.invoke_close_channel())
-            self.assertEqual(0, self.admin_channel.queue_declare(RMQChannelTest.test_channel_name,
+            self.assertEqual(0, self.admin_channel.queue_declare(self.test_channel_name,
                                                                  passive=True).message_count)
             self.assertTrue(channel_reader.invoke_resource_deletion())
 
     def test_channel_reader_has_records_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
             self.assertTrue(channel_reader.invoke_open_channel())
             self.assertFalse(channel_reader.has_records())
-            for idx in range(200):
-                self.admin_channel.basic_publish(Message(str(f"dummy_{idx}")),
-                                                 routing_key=RMQChannelTest.test_channel_name)
+            self._publish_dummy_records(200)
             self.assertTrue(channel_reader.has_records())
         finally:
             self.assertTrue(channel_reader.invoke_close_channel())
             self.assertTrue(channel_reader.invoke_resource_deletion())
 
     def test_channel_reader_can_close_without_replication_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
@@ -546,9 +588,7 @@ class RMQChannelTest(unittest.TestCase):
         operator_context = BlankOperator("blank")
         operator_context.__setattr__("reader", BlankInputPortPlugin("reader", context=operator_context))
         operator_context.set_parameter("replicationFactor", 1)
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=operator_context.reader)
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader(operator_context.reader)
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
@@ -558,39 +598,15 @@ class RMQChannelTest(unittest.TestCase):
             self.assertTrue(channel_reader.can_close())
 
             # With connected replica channel
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name=operator_context.get_replica(0).reader.get_full_name(),
-                        channel_group_name=operator_context.get_replica(0).reader.get_group_name(),
-                        channel_group_index=operator_context.get_replica(0).reader.get_group_index(),
-                        status=ChannelStatus.Opened
-                    )
-                )), routing_key=RMQChannelTest.test_writer_status_queue_name)
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name=operator_context.get_replica(0).reader.get_full_name(),
-                        channel_group_name=operator_context.get_replica(0).reader.get_group_name(),
-                        channel_group_index=operator_context.get_replica(0).reader.get_group_index(),
-                        status=ChannelStatus.HealthCheck
-                    )
-                )), routing_key=RMQChannelTest.test_writer_status_queue_name)
+            self._publish_status_message(self.test_writer_status_queue_name, operator_context.get_replica(0).reader,
+                                         ChannelStatus.Opened)
+            self._publish_status_message(self.test_writer_status_queue_name, operator_context.get_replica(0).reader,
+                                         ChannelStatus.HealthCheck)
             self.assertFalse(channel_reader.can_close())
 
             # With connected and closed channel
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name=operator_context.get_replica(0).reader.get_full_name(),
-                        channel_group_name=operator_context.get_replica(0).reader.get_group_name(),
-                        channel_group_index=operator_context.get_replica(0).reader.get_group_index(),
-                        status=ChannelStatus.Closed
-                    )
-                )), routing_key=RMQChannelTest.test_writer_status_queue_name)
+            self._publish_status_message(self.test_writer_status_queue_name, operator_context.get_replica(0).reader,
+                                         ChannelStatus.Closed)
             self.assertTrue(channel_reader.can_close())
         finally:
             self.assertTrue(channel_reader.invoke_close_channel())
@@ -600,9 +616,7 @@ class RMQChannelTest(unittest.TestCase):
         operator_context = BlankOperator("blank")
         operator_context.__setattr__("reader", BlankInputPortPlugin("reader", context=operator_context))
         operator_context.set_parameter("replicationFactor", 2)
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=operator_context.get_replica(1).reader)
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader(operator_context.get_replica(1).reader)
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
@@ -612,56 +626,28 @@ class RMQChannelTest(unittest.TestCase):
             self.assertTrue(channel_reader.can_close())
 
             # With connected replica channel
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name=operator_context.get_replica(0).reader.get_full_name(),
-                        channel_group_name=operator_context.get_replica(0).reader.get_group_name(),
-                        channel_group_index=operator_context.get_replica(0).reader.get_group_index(),
-                        status=ChannelStatus.Opened
-                    )
-                )), routing_key=RMQChannelTest.test_writer_status_queue_name)
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name=operator_context.get_replica(0).reader.get_full_name(),
-                        channel_group_name=operator_context.get_replica(0).reader.get_group_name(),
-                        channel_group_index=operator_context.get_replica(0).reader.get_group_index(),
-                        status=ChannelStatus.HealthCheck
-                    )
-                )), routing_key=RMQChannelTest.test_writer_status_queue_name)
+            self._publish_status_message(self.test_writer_status_queue_name, operator_context.get_replica(0).reader,
+                                         ChannelStatus.Opened)
+            self._publish_status_message(self.test_writer_status_queue_name, operator_context.get_replica(0).reader,
+                                         ChannelStatus.HealthCheck)
             self.assertTrue(channel_reader.can_close())
 
             # With connected and closed channel
-            self.admin_channel.basic_publish(Message(
-                str(
-                    ChannelStatusMessage(
-                        channel_name=RMQChannelTest.test_channel_name,
-                        channel_context_name=operator_context.get_replica(0).reader.get_full_name(),
-                        channel_group_name=operator_context.get_replica(0).reader.get_group_name(),
-                        channel_group_index=operator_context.get_replica(0).reader.get_group_index(),
-                        status=ChannelStatus.Closed
-                    )
-                )), routing_key=RMQChannelTest.test_writer_status_queue_name)
+            self._publish_status_message(self.test_writer_status_queue_name, operator_context.get_replica(0).reader,
+                                         ChannelStatus.Closed)
             self.assertTrue(channel_reader.can_close())
         finally:
             self.assertTrue(channel_reader.invoke_close_channel())
             self.assertTrue(channel_reader.invoke_resource_deletion())
 
     def test_channel_reader_max_poll_record_1_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         channel_reader.invoke_configure_channel({"max_poll_records": 1})
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
             self.assertTrue(channel_reader.invoke_open_channel())
-            for idx in range(100):
-                self.admin_channel.basic_publish(Message(str(f"dummy_{idx}")),
-                                                 routing_key=RMQChannelTest.test_channel_name)
+            self._publish_dummy_records(100)
             retrieved = channel_reader.invoke_read_records()
             self.assertEqual(1, len(retrieved))
             channel_reader.invoke_commit_current_read_offset()
@@ -673,17 +659,13 @@ class RMQChannelTest(unittest.TestCase):
             self.assertTrue(channel_reader.invoke_resource_deletion())
 
     def test_channel_reader_max_poll_record_27_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
         channel_reader.invoke_configure_channel({"max_poll_records": 27})
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
             self.assertTrue(channel_reader.invoke_open_channel())
-            for idx in range(100):
-                self.admin_channel.basic_publish(Message(str(f"dummy_{idx}")),
-                                                 routing_key=RMQChannelTest.test_channel_name)
+            self._publish_dummy_records(100)
             retrieved = channel_reader.invoke_read_records()
             self.assertEqual(27, len(retrieved))
             channel_reader.invoke_commit_current_read_offset()
@@ -695,12 +677,8 @@ class RMQChannelTest(unittest.TestCase):
             self.assertTrue(channel_reader.invoke_resource_deletion())
 
     def test_channel_reader_writer_connection_expect_ok(self):
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader"))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer"))
-        channel_writer.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader()
+        channel_writer = self._create_channel_writer()
 
         try:
             self.assertTrue(channel_writer.invoke_resource_creation())
@@ -736,12 +714,8 @@ class RMQChannelTest(unittest.TestCase):
         }
         """
 
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader", schema=avro_schema_string))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer", schema=avro_schema_string))
-        channel_writer.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader(BlankInputPortPlugin("reader", schema=avro_schema_string))
+        channel_writer = self._create_channel_writer(BlankOutputPortPlugin("writer", schema=avro_schema_string))
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
@@ -782,12 +756,8 @@ class RMQChannelTest(unittest.TestCase):
         }
         """
 
-        channel_reader = RMQChannelReader(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankInputPortPlugin("reader", schema=avro_schema_string))
-        channel_reader.set_location(RMQChannelTest.bootstrap_url)
-        channel_writer = RMQChannelWriter(channel_name=RMQChannelTest.test_channel_name,
-                                          context=BlankOutputPortPlugin("writer", schema=avro_schema_string))
-        channel_writer.set_location(RMQChannelTest.bootstrap_url)
+        channel_reader = self._create_channel_reader(BlankInputPortPlugin("reader", schema=avro_schema_string))
+        channel_writer = self._create_channel_writer(BlankOutputPortPlugin("writer", schema=avro_schema_string))
 
         try:
             self.assertTrue(channel_reader.invoke_resource_creation())
@@ -0,0 +1,336 @@
+# =============================================================================
+# Copyright (c) 2024 by Laszlo Anka. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+import io
+import unittest
+from unittest import mock
+
+from avro.io import DatumWriter, BinaryEncoder
+from avro.schema import parse
+
+from amqp.exceptions import MessageNacked
+
+from pypz.plugins.rmq_io.utils import compile_record_encoder, MessageProducer, MessageConsumer, \
+    PrefetchGrowthFullPollCount, AvailableRecordCacheTimeSec
+
+avro_schema_string = """
+{
+    "type": "record",
+    "name": "TestRecord",
+    "fields": [
+        {"name": "int_field", "type": "int"},
+        {"name": "long_field", "type": "long"},
+        {"name": "string_field", "type": "string"},
+        {"name": "bytes_field", "type": "bytes"},
+        {"name": "boolean_field", "type": "boolean"},
+        {"name": "float_field", "type": "float"},
+        {"name": "double_field", "type": "double"},
+        {"name": "null_field", "type": "null"}
+    ]
+}
+"""
+
+
+class RecordEncoderTest(unittest.TestCase):
+
+    def test_record_encoder_output_matches_datum_writer_expect_ok(self):
+        schema = parse(avro_schema_string)
+        record_encoder = compile_record_encoder(schema)
+        datum_writer = DatumWriter(writers_schema=schema)
+
+        self.assertIsNotNone(record_encoder)
+
+        for record in [
+            {"int_field": 0, "long_field": 0, "string_field": "", "bytes_field": b"",
+             "boolean_field": False, "float_field": 0.0, "double_field": 0.0, "null_field": None},
+            {"int_field": -2147483648, "long_field": 9223372036854775807, "string_field": "árvíztűrő",
+             "bytes_field": b"\x00\xff" * 100, "boolean_field": True, "float_field": -1.5,
+             "double_field": 3.14159, "null_field": None},
+        ]:
+            encoded_record = bytearray()
+            expected_record = io.BytesIO()
+            datum_writer.write(record, BinaryEncoder(expected_record))
+
+            self.assertTrue(record_encoder(record, encoded_record))
+            self.assertEqual(expected_record.getvalue(), bytes(encoded_record))
+
+    def test_record_encoder_with_invalid_record_expect_fallback(self):
+        record_encoder = compile_record_encoder(parse(avro_schema_string))
+        valid_record = {"int_field": 0, "long_field": 0, "string_field": "", "bytes_field": b"",
+                        "boolean_field": False, "float_field": 0.0, "double_field": 0.0, "null_field": None}
+
+        for invalid_record in [
+            None,
+            [],
+            {**valid_record, "unknown_field": 0},
+            {**valid_record, "int_field": 2147483648},
+            {**valid_record, "int_field": "0"},
+            {**valid_record, "string_field": None},
+            {key: value for key, value in valid_record.items() if "long_field" != key},
+        ]:
+            encoded_record = bytearray()
+            self.assertFalse(record_encoder(invalid_record, encoded_record))
+            self.assertEqual(0, len(encoded_record))
+
+    def test_record_encoder_with_unsupported_schema_expect_none(self):
+        self.assertIsNone(compile_record_encoder(parse('"string"')))
+        self.assertIsNone(compile_record_encoder(parse(
+            '{"type": "record", "name": "r", "fields": [{"name": "f", "type": ["null", "string"]}]}'
+        )))
+        self.assertIsNone(compile_record_encoder(parse(
+            '{"type": "record", "name": "r", "fields": [{"name": "f", '
+            '"type": {"type": "int", "logicalType": "date"}}]}'
+        )))
+
+
+class MessageConsumerTest(unittest.TestCase):
+    """
+    Tests of the consumer with a mocked connection, hence no broker is required
+    """
+
+    @staticmethod
+    def _create_consumer(max_poll_record: int = 2, **kwargs) -> MessageConsumer:
+        consumer = MessageConsumer("consumer", max_poll_record, mock.MagicMock(), **kwargs)
+        # Without a broker, there is never a message to wait for
+        consumer._connection.drain_events.side_effect = TimeoutError
+        consumer.subscribe("queue")
+        return consumer
+
+    @staticmethod
+    def _poll_full_batch(consumer: MessageConsumer) -> list:
+        for _ in range(consumer._max_poll_record):
+            consumer._retrieved_data_messages.append(mock.Mock(delivery_tag=len(consumer._retrieved_data_messages)))
+        return consumer.poll(timeout=0)
+
+    def test_consumer_prefetch_growth_with_full_polls_expect_grown_until_max(self):
+        consumer = self._create_consumer(max_poll_record=2, max_prefetch_count=6)
+        consumer._channel.basic_qos.assert_called_once_with(0, 2, False)
+
+        for prefetch_count in [4, 6]:
+            for _ in range(PrefetchGrowthFullPollCount):
+                self.assertEqual(2, len(self._poll_full_batch(consumer)))
+
+            with self.subTest(prefetch_count=prefetch_count):
+                self.assertEqual(prefetch_count, consumer._prefetch_count)
+                consumer._channel.basic_qos.assert_called_with(0, prefetch_count, False)
+                consumer._channel.basic_cancel.assert_called_with(consumer_tag="consumer-queue")
+
+        for _ in range(PrefetchGrowthFullPollCount):
+            self._poll_full_batch(consumer)
+
+        self.assertEqual(6, consumer._prefetch_count)
+        self.assertEqual(3, consumer._channel.basic_qos.call_count)
+
+    def test_consumer_prefetch_growth_with_interrupted_full_polls_expect_unchanged(self):
+        consumer = self._create_consumer(max_poll_record=2, max_prefetch_count=8)
+
+        for _ in range(PrefetchGrowthFullPollCount - 1):
+            self._poll_full_batch(consumer)
+        consumer._retrieved_data_messages.append(mock.Mock(delivery_tag=0))
+        self.assertEqual(1, len(consumer.poll(timeout=0)))
+        for _ in range(PrefetchGrowthFullPollCount - 1):
+            self._poll_full_batch(consumer)
+
+        self.assertEqual(2, consumer._prefetch_count)
+        consumer._channel.basic_qos.assert_called_once()
+
+    def test_consumer_prefetch_reset_with_empty_poll_expect_initial(self):
+        consumer = self._create_consumer(max_poll_record=2, max_prefetch_count=8)
+
+        for _ in range(PrefetchGrowthFullPollCount):
+            self._poll_full_batch(consumer)
+        self.assertEqual(4, consumer._prefetch_count)
+
+        self.assertEqual([], consumer.poll(timeout=0))
+
+        self.assertEqual(2, consumer._prefetch_count)
+        consumer._channel.basic_qos.assert_called_with(0, 2, False)
+
+    def test_consumer_prefetch_without_max_expect_unchanged(self):
+        consumer = self._create_consumer(max_poll_record=2)
+
+        for _ in range(PrefetchGrowthFullPollCount * 2):
+            self._poll_full_batch(consumer)
+
+        self.assertEqual(2, consumer._prefetch_count)
+        consumer._channel.basic_qos.assert_called_once()
+
+    def test_consumer_has_records_expect_positive_count_cached(self):
+        consumer = self._create_consumer()
+        queue_declare = consumer._channel.queue_declare
+
+        with mock.patch("pypz.plugins.rmq_io.utils.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            queue_declare.return_value.message_count = 1
+            self.assertTrue(consumer.has_records())
+            self.assertEqual(1, queue_declare.call_count)
+
+            with self.subTest("within cache time expect no query"):
+                queue_declare.return_value.message_count = 0
+                monotonic.return_value = 100.0 + AvailableRecordCacheTimeSec / 2
+                self.assertTrue(consumer.has_records())
+                self.assertEqual(1, queue_declare.call_count)
+
+            with self.subTest("after cache time expect query"):
+                monotonic.return_value = 100.0 + AvailableRecordCacheTimeSec * 2
+                self.assertFalse(consumer.has_records())
+                self.assertEqual(2, queue_declare.call_count)
+
+            with self.subTest("zero count not cached"):
+                queue_declare.return_value.message_count = 1
+                self.assertTrue(consumer.has_records())
+                self.assertEqual(3, queue_declare.call_count)
+
+    def test_consumer_has_records_with_buffered_messages_expect_no_query(self):
+        consumer = self._create_consumer()
+        consumer._retrieved_data_messages.append(mock.Mock(delivery_tag=1))
+
+        self.assertTrue(consumer.has_records())
+        consumer._channel.queue_declare.assert_not_called()
+
+
+class MessageProducerTest(unittest.TestCase):
+    """
+    Tests of the producer with a mocked connection, hence no broker is required
+    """
+
+    @staticmethod
+    def _create_producer(confirm_publish: bool = False) -> tuple[MessageProducer, list]:
+        producer = MessageProducer(connection=mock.MagicMock(), confirm_publish=confirm_publish)
+        published_messages = []
+        # The message objects are reused, hence their content is captured at publishing
+        producer._channel.basic_publish.side_effect = \
+            lambda message, **kwargs: published_messages.append((message.body, kwargs))
+        return producer, published_messages
+
+    def test_producer_publish_many_expect_all_published(self):
+        producer, published_messages = self._create_producer()
+
+        producer.publish_many(["text", b"binary"], exchange_name="exchange")
+
+        self.assertEqual([
+            ("text", {"mandatory": True, "exchange": "exchange", "routing_key": ""}),
+            (b"binary", {"mandatory": True, "exchange": "exchange", "routing_key": ""}),
+        ], published_messages)
+        producer._connection.drain_events.assert_not_called()
+
+    def test_producer_publish_many_in_confirm_mode_expect_confirmations_awaited(self):
+        producer, published_messages = self._create_producer(confirm_publish=True)
+        producer._channel.confirm_select.assert_called_once()
+        producer._connection.drain_events.side_effect = \
+            lambda timeout: producer._on_confirm(delivery_tag=producer._published_count, multiple=True)
+
+        producer.publish_many(["0", "1", "2"], queue_name="queue")
+        producer.publish_many(["3"], queue_name="queue")
+
+        self.assertEqual(["0", "1", "2", "3"], [body for body, _ in published_messages])
+        self.assertEqual(4, producer._confirmed_count)
+        self.assertEqual(2, producer._connection.drain_events.call_count)
+
+    def test_producer_flush_in_confirm_mode_with_nack_expect_error(self):
+        producer, _ = self._create_producer(confirm_publish=True)
+        producer._connection.drain_events.side_effect = \
+            lambda timeout: producer._on_reject(delivery_tag=producer._published_count, multiple=True)
+
+        with self.assertRaises(MessageNacked):
+            producer.publish_many(["0", "1"])
+
+        with self.subTest("nack reported once"):
+            producer.flush()
+
+    def test_producer_flush_without_confirm_mode_expect_no_wait(self):
+        producer, _ = self._create_producer()
+
+        producer.publish("message")
+        producer.flush()
+
+        producer._connection.drain_events.assert_not_called()
+
+
+class MessageProducerPoolTest(unittest.TestCase):
+    """
+    Tests of the producer pool with mocked connections, hence no broker is required
+    """
+
+    def setUp(self):
+        MessageProducer.drain_pool()
+
+    def tearDown(self):
+        MessageProducer.drain_pool()
+
+    @staticmethod
+    def _create_pooled_producer(confirm_publish: bool = False) -> MessageProducer:
+        producer = MessageProducer(connection=mock.MagicMock(), confirm_publish=confirm_publish)
+        producer._pool_key = ("localhost", confirm_publish)
+        return producer
+
+    def test_producer_close_returns_to_pool_expect_reused(self):
+        producer = self._create_pooled_producer()
+        producer.close()
+
+        producer._connection.close.assert_not_called()
+        self.assertIs(producer, MessageProducer.acquire("localhost"))
+
+    def test_producer_acquire_with_dead_pooled_connection_expect_new_producer(self):
+        producer = self._create_pooled_producer()
+        producer.close()
+        # The client side flags still report the connection as open
+        producer._connection.drain_events.side_effect = IOError("Server unexpectedly closed connection")
+
+        with mock.patch("pypz.plugins.rmq_io.utils.Connection") as connection_type:
+            acquired_producer = MessageProducer.acquire("localhost")
+
+        self.assertIsNot(producer, acquired_producer)
+        connection_type.assert_called_once_with(host="localhost")
+        producer._connection.close.assert_called_once()
+        self.assertEqual(0, len(MessageProducer._pool[("localhost", False)]))
+
+    def test_producer_acquire_with_alive_pooled_connection_expect_reused(self):
+        producer = self._create_pooled_producer()
+        producer.close()
+        producer._connection.drain_events.side_effect = TimeoutError
+
+        self.assertIs(producer, MessageProducer.acquire("localhost"))
+        producer._connection.drain_events.assert_called_once_with(timeout=0)
+
+    def test_producer_close_with_lost_connection_expect_not_pooled(self):
+        producer = self._create_pooled_producer()
+        producer._connection.connected = False
+        producer.close()
+
+        producer._connection.close.assert_called_once()
+        self.assertNotIn(producer, MessageProducer._pool.get(("localhost", False), []))
+
+    def test_producer_close_with_nacked_messages_expect_error(self):
+        producer = self._create_pooled_producer(confirm_publish=True)
+        producer.publish("message")
+        producer._on_reject(delivery_tag=1, multiple=False)
+
+        with self.assertRaises(MessageNacked):
+            producer.close()
+
+        producer._connection.close.assert_called_once()
+        self.assertNotIn(producer, MessageProducer._pool.get(("localhost", True), []))
+
+    def test_drain_pool_expect_idle_producers_closed(self):
+        producers = [self._create_pooled_producer(), self._create_pooled_producer(confirm_publish=True)]
+        for producer in producers:
+            producer.close()
+
+        MessageProducer.drain_pool()
+
+        for producer in producers:
+            producer._connection.close.assert_called_once()
+        self.assertEqual(0, len(MessageProducer._pool))
@@ -13,23 +13,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # =============================================================================
+import concurrent.futures
+import logging
 import uuid
-from threading import Thread
+from threading import Event
 from typing import Callable, Optional
 
-from pypz.core.commons.utils import SynchronizedReference
-
 from pypz.abstracts.channel_ports import ChannelInputPort, ChannelOutputPort
 from pypz.core.channels.status import ChannelStatusMessage
 from pypz.core.specs.misc import BlankOutputPortPlugin, BlankInputPortPlugin
 from pypz.core.specs.pipeline import Pipeline
+from pypz.core.specs.plugin import PortPlugin
+
+MaxParallelChannelSnifferOperationCount = 32
+
+logger = logging.getLogger(__name__)
+
+
+def get_principal_port(port: PortPlugin) -> PortPlugin:
+    principal_port = port.get_group_principal()
+    return port if principal_port is None else principal_port
 
 
 class ChannelSniffer:
     def __init__(self, input_port: ChannelInputPort, output_port: ChannelOutputPort):
-        self.channel_name = input_port.get_full_name() \
-            if input_port.get_group_principal() is None \
-            else input_port.get_group_principal().get_full_name()
+        self.channel_name = get_principal_port(input_port).get_full_name()
 
         context_uuid = uuid.uuid4()
 
@@ -64,73 +72,99 @@ class ChannelSniffer:
 
     def on_status_message(self, status_messages: list[ChannelStatusMessage]):
         for status_message in status_messages:
-            if status_message.channel_context_name in self.on_status_update_callbacks:
-                self.on_status_update_callbacks[status_message.channel_context_name](status_message)
+            callback = self.on_status_update_callbacks.get(status_message.channel_context_name)
+            if callback is not None:
+                callback(status_message)
 
 
 class PipelineSniffer:
     def __init__(self, pipeline: Pipeline):
         self.channel_sniffers: dict[str, ChannelSniffer] = dict()
 
-        self.control_thread: Optional[Thread] = None
+        self.control_executor: concurrent.futures.ThreadPoolExecutor = \
+            concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.control_future: Optional[concurrent.futures.Future] = None
 
-        self.all_opened: SynchronizedReference[bool] = SynchronizedReference(False)
-        self.all_closed: SynchronizedReference[bool] = SynchronizedReference(False)
+        self.all_opened: Event = Event()
+        self.all_closed: Event = Event()
+
+        channel_ports: dict[str, tuple[ChannelInputPort, ChannelOutputPort]] = dict()
 
         for operator in pipeline.get_protected().get_nested_instances().values():
-            if operator.is_principal():
-                for input_port in operator.get_protected().get_nested_instances().values():
-                    if isinstance(input_port, ChannelInputPort):
-                        for output_port in input_port.get_connected_ports():
-                            if isinstance(output_port, ChannelOutputPort):
-                                channel_id = PipelineSniffer.get_channel_id(input_port, output_port)
-                                if channel_id in self.channel_sniffers:
-                                    raise AttributeError(f"Channel id already existing: {channel_id}")
+            if not operator.is_principal():
+                continue
+
+            for input_port in operator.get_protected().get_nested_instances().values():
+                if not isinstance(input_port, ChannelInputPort):
+                    continue
+
+                for output_port in input_port.get_connected_ports():
+                    if not isinstance(output_port, ChannelOutputPort):
+                        continue
+
+                    channel_id = PipelineSniffer.get_channel_id(input_port, output_port)
+                    if channel_id in channel_ports:
+                        raise AttributeError(f"Channel id already existing: {channel_id}")
 
-                                self.channel_sniffers[channel_id] = ChannelSniffer(input_port, output_port)
+                    channel_ports[channel_id] = (input_port, output_port)
+
+        # The sniffers are only created, once all channel ids have been validated
+        for channel_id, (input_port, output_port) in channel_ports.items():
+            self.channel_sniffers[channel_id] = ChannelSniffer(input_port, output_port)
 
     @staticmethod
     def get_channel_id(input_port: ChannelInputPort, output_port: ChannelOutputPort) -> str:
-        principal_input_port = input_port \
-            if input_port.get_group_principal() is None else input_port.get_group_principal()
-        principal_output_port = output_port \
-            if output_port.get_group_principal() is None else output_port.get_group_principal()
-
-        return f"{principal_input_port.get_full_name()}+{principal_output_port.get_full_name()}"
+        return f"{get_principal_port(input_port).get_full_name()}+{get_principal_port(output_port).get_full_name()}"
 
     def get_channel_sniffer_by_port(self, input_port: ChannelInputPort, output_port: ChannelOutputPort):
         return self.channel_sniffers[PipelineSniffer.get_channel_id(input_port, output_port)]
 
+    def _invoke_on_all_channel_sniffers(self, method: Callable[[ChannelSniffer], bool]) -> bool:
+        """
+        Invokes the specified method on all channel sniffers in parallel, since opening
+        and closing the channels is dominated by waiting for the channel backends.
+
+        :param method: method of the ChannelSniffer to invoke
+        :return: True, if the method returned True for all channel sniffers
+        """
+
+        if 0 == len(self.channel_sniffers):
+            return True
+
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(MaxParallelChannelSnifferOperationCount, len(self.channel_sniffers))
+        ) as executor:
+            return all(list(executor.map(method, self.channel_sniffers.values())))
+
     def _start(self):
-        all_opened = True
-        for channel_sniffer in self.channel_sniffers.values():
-            if not channel_sniffer.open():
-                all_opened = False
-        self.all_opened.set(all_opened)
+        if self._invoke_on_all_channel_sniffers(ChannelSniffer.open):
+            self.all_opened.set()
 
     def _stop(self):
-        all_closed = True
-        for channel_sniffer in self.channel_sniffers.values():
-            if not channel_sniffer.close():
-                all_closed = False
-        self.all_closed.set(all_closed)
+        if self._invoke_on_all_channel_sniffers(ChannelSniffer.close):
+            self.all_closed.set()
 
-    def start(self) -> bool:
-        if (self.control_thread is not None) and (not self.control_thread.is_alive()):
-            self.control_thread = None
+    @staticmethod
+    def _on_control_done(future: concurrent.futures.Future):
+        # Nothing else reads the result of the future, hence failures
+        # would go unnoticed without logging them here.
+        if (not future.cancelled()) and (future.exception() is not None):
+            logger.error("Sniffer control operation failed", exc_info=future.exception())
 
-        if (self.control_thread is None) and (not self.all_opened.get()):
-            self.control_thread = Thread(target=self._start)
-            self.control_thread.start()
+    def start(self) -> bool:
+        if ((self.control_future is None) or self.control_future.done()) and (not self.all_opened.is_set()):
+            self.control_future = self.control_executor.submit(self._start)
+            self.control_future.add_done_callback(PipelineSniffer._on_control_done)
 
-        return self.all_opened.get()
+        return self.all_opened.is_set()
 
     def stop(self) -> bool:
-        if (self.control_thread is not None) and (not self.control_thread.is_alive()):
-            self.control_thread = None
+        if self.all_closed.is_set():
+            self.control_executor.shutdown(wait=False)
+            return True
 
-        if (self.control_thread is None) and (not self.all_closed.get()):
-            self.control_thread = Thread(target=self._stop)
-            self.control_thread.start()
+        if (self.control_future is None) or self.control_future.done():
+            self.control_future = self.control_executor.submit(self._stop)
+            self.control_future.add_done_callback(PipelineSniffer._on_control_done)
 
-        return self.all_closed.get()
+        return self.all_closed.is_set()
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # =============================================================================
+from typing import Iterator
+
 from pypz.core.specs.operator import Operator
 from pypz.core.specs.pipeline import Pipeline
 from pypz.core.specs.plugin import OutputPortPlugin
@@ -28,24 +30,59 @@ def is_sublist(subset: list, target_list: list) -> bool:
     if subset_len > target_len:
         return False
 
-    for i in range(target_len - subset_len + 1):
-        if target_list[i:i + subset_len] == subset:
+    # Only the positions holding the first element of the subset are compared,
+    # which are looked up by the native list.index() instead of a Python loop.
+    first_element = subset[0]
+    last_start_position = target_len - subset_len
+    position = -1
+    while True:
+        try:
+            position = target_list.index(first_element, position + 1, last_start_position + 1)
+        except ValueError:
+            return False
+
+        if target_list[position:position + subset_len] == subset:
             return True
 
-    return False
-
 
-def retrieve_operator_paths(operator: Operator, visited: set[Operator] = None) -> list[list[Operator]]:
-    result_paths = []
-    visited = {operator} if visited is None else visited
+def retrieve_connected_operators(operator: Operator) -> Iterator[Operator]:
     for plugin in operator.get_protected().get_nested_instances().values():
         if isinstance(plugin, OutputPortPlugin):
             for input_port in plugin.get_connected_ports():
-                if input_port.get_context() not in visited:
-                    result_paths.extend([[operator] + retrieved_path
-                                         for retrieved_path in
-                                         retrieve_operator_paths(input_port.get_context(), visited)])
-    return result_paths if 0 < len(result_paths) else [[operator]]
+                yield input_port.get_context()
+
+
+def retrieve_operator_paths(operator: Operator) -> list[list[Operator]]:
+    """
+    This function retrieves all paths along the connections starting from the specified
+    operator. A path ends, if the last operator has no connected operators, which are
+    not already on the path, so circular dependencies are resolved. The paths are
+    traversed by backtracking on a single path instead of recursion, so only the
+    completed paths are copied. The operators on the path are tracked by their full
+    names, which spares the invocation of Instance.__hash__ on every check.
+    """
+
+    result_paths = []
+    current_path = [operator]
+    operators_on_path = {operator.get_full_name()}
+    # Each entry holds the connected operators not yet visited and whether any of them has been followed
+    stack: list[tuple[Iterator[Operator], bool]] = [(retrieve_connected_operators(operator), False)]
+
+    while stack:
+        connected_operators, followed = stack[-1]
+        connected_operator = next(connected_operators, None)
+        if connected_operator is None:
+            if not followed:
+                result_paths.append(current_path.copy())
+            stack.pop()
+            operators_on_path.discard(current_path.pop().get_full_name())
+        elif connected_operator.get_full_name() not in operators_on_path:
+            stack[-1] = (connected_operators, True)
+            current_path.append(connected_operator)
+            operators_on_path.add(connected_operator.get_full_name())
+            stack.append((retrieve_connected_operators(connected_operator), False))
+
+    return result_paths
 
 
 def order_operators_by_connections(pipeline: Pipeline) -> list[set[Operator]]:
@@ -74,74 +111,92 @@ def order_operators_by_connections(pipeline: Pipeline) -> list[set[Operator]]:
        [0] - {A,B}
        [1] - {C}
        [2] - {D,E}
-       [3] - {F}
-       [4] - {G}
+       [3] - {F,G}
 
     This information can then be used amongst more to draw the operators in the proper
     order and position to visualize their connections.
     Note that this method is capable to handle circular dependencies.
     """
 
-    paths: list = list()
+    principal_operators = [operator for operator in pipeline.get_protected().get_nested_instances().values()
+                           if operator.is_principal()]
+    connected_operators = {input_port.get_context()
+                           for operator in principal_operators
+                           for plugin in operator.get_protected().get_nested_instances().values()
+                           if isinstance(plugin, OutputPortPlugin)
+                           for input_port in plugin.get_connected_ports()}
+
     # Step 1)
-    # Extracting the paths. Using the example in the docs, the expected result:
-    # [0] - [A, C, D, F, G]
-    # [1] - [A, C, E, G]
-    # [2] - [B, C, E, G]
-    # [3] - [B, C, D, F, G]
-    # =========================================================================
-    for operator in pipeline.get_protected().get_nested_instances().values():
-        if operator.is_principal() and (not any([operator in path for path in paths])):
-            paths.extend(retrieve_operator_paths(operator))
+    # Leveling the operators reachable from the ones without incoming connections by
+    # a breadth-first traversal, so each operator is placed on its shortest distance
+    # from any of these operators. Using the example in the docs, the expected result:
+    # A -> 0, B -> 0, C -> 1, D -> 2, E -> 2, F -> 3, G -> 3
+    # This way the paths along the connections don't need to be enumerated, whose
+    # count can grow exponentially with the branches and merges.
+    # ==================================================================================
+    operator_levels: dict[Operator, int] = {operator: 0 for operator in principal_operators
+                                            if operator not in connected_operators}
+    current_operators = list(operator_levels)
+    current_level = 0
+    while current_operators:
+        current_level += 1
+        next_operators = []
+        for operator in current_operators:
+            for connected_operator in retrieve_connected_operators(operator):
+                if connected_operator not in operator_levels:
+                    operator_levels[connected_operator] = current_level
+                    next_operators.append(connected_operator)
+        current_operators = next_operators
 
     # Step 2)
-    # Removing all paths that are sublist of any other paths. This is necessary,
-    # because we don't have control over, in which order the operators are stored
-    # and iterated over, so there can be a situation, where the previous step
-    # produces something like this:
+    # The operators not reached yet are part of or downstream of circular dependencies.
+    # In this case, we don't have control over, in which order the operators are stored
+    # and iterated over, so there can be a situation, where the paths started from these
+    # operators are something like this:
     # [0] - [E, G]
     # [1] - [C, E, G]
     # [2] - [A, C, E, G]
     # The first 2 is sub-path of the 3. therefore shall be removed.
-    # ============================================================================
-    cleaned_paths = [path for path in paths
-                     if not any([is_sublist(path, target_path) and (path != target_path) for target_path in paths])]
+    # To check the sub-paths, each operator is mapped to a unique character, so
+    # the paths can be compared by the native substring search of str instead
+    # of comparing the slices of the paths one by one. Notice that these paths
+    # can lead to operators already leveled in step 1), which is resolved in step 3).
+    # ===================================================================================
+    reached_operators = set(operator_levels)
+    circular_paths: list = list()
+    for operator in principal_operators:
+        if operator not in reached_operators:
+            retrieved_paths = retrieve_operator_paths(operator)
+            reached_operators.update(operator for path in retrieved_paths for operator in path)
+            circular_paths.extend(retrieved_paths)
+
+    operator_codes: dict[Operator, str] = dict()
+    path_strings = ["".join([operator_codes.setdefault(operator, chr(len(operator_codes))) for operator in path])
+                    for path in circular_paths]
+    cleaned_paths = [path for path, path_string in zip(circular_paths, path_strings)
+                     if not any((path_string in target_string) and (path_string != target_string)
+                                for target_string in path_strings)]
 
     # Step 3)
-    # Converting path into list of sets. Using the example in the docs, the expected result:
-    # [0] -> {A, B}
-    # [1] -> {C}
-    # [2] -> {D, E}
-    # [3] -> {F, G}
-    # [4] -> {G}
-    # =======================================================================================
-    dependency_levels: list = []
+    # Leveling the operators along the remaining paths. Each operator is represented only
+    # once in the ordered list, the rule is that the lowest level found survives.
+    # ======================================================================================
     for path in cleaned_paths:
-        for idx, node in enumerate(path):
-            if idx == len(dependency_levels):
-                dependency_levels.append(set())
-            dependency_levels[idx].add(node)
+        for idx, operator in enumerate(path):
+            if idx < operator_levels.get(operator, idx + 1):
+                operator_levels[operator] = idx
 
     # Step 4)
-    # We need to make sure that each operator is represented only once in the ordered list. The rule
-    # is that we start to iterate from the end of the list and the first one of the duplicates found
-    # survives, the rest shall be removed.
-    # Using the example results from step 3), the expected result is:
+    # Converting the levels into list of sets. Using the example in the docs, the expected result:
     # [0] -> {A, B}
     # [1] -> {C}
     # [2] -> {D, E}
-    # [3] -> {F}
-    # [4] -> {G}
-    # Notice that G has been removed from [3], because it has been found on [4]
-    # ================================================================================================
-
-    found = set()
-    for dependency_level in dependency_levels:
-        set_copy = dependency_level.copy()
-        for operator in set_copy:
-            if operator not in found:
-                found.add(operator)
-            else:
-                dependency_level.remove(operator)
+    # [3] -> {F, G}
+    # ============================================================================================
+    dependency_levels: list = []
+    for operator, level in operator_levels.items():
+        while level >= len(dependency_levels):
+            dependency_levels.append(set())
+        dependency_levels[level].add(operator)
 
     return dependency_levels
@@ -16,14 +16,16 @@
 import time
 import tkinter as tk
 from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Optional
 
 from pypz.sniffer.sniffer import PipelineSniffer
 from pypz.sniffer.utils import order_operators_by_connections
-from pypz.sniffer.views import OperatorView, ChannelView, ChannelRWView, ViewConfig
+from pypz.sniffer.views import OperatorView, ChannelView, ChannelRWView, ViewConfig, PortView
 from pypz.abstracts.channel_ports import ChannelInputPort, ChannelOutputPort
 from pypz.core.specs.dtos import PipelineInstanceDTO
 from pypz.core.specs.operator import Operator
 from pypz.core.specs.pipeline import Pipeline
+from pypz.core.specs.plugin import PortPlugin
 
 
 class PipelineSnifferViewer(tk.Tk):
@@ -45,15 +47,22 @@ class PipelineSnifferViewer(tk.Tk):
         self._pipeline: Pipeline = pipeline
         self._pipeline_sniffer: PipelineSniffer = PipelineSniffer(pipeline)
         self._executor: ThreadPoolExecutor = ThreadPoolExecutor()
-        self._sniffer_futures: set[Future] = set()
+        self._pending_sniff_count: int = 0
+        self._sniff_submission_time: float = 0.0
+        self._sniff_methods: tuple[Callable[[], None], ...] = tuple(
+            channel_sniffer.sniff for channel_sniffer in self._pipeline_sniffer.channel_sniffers.values()
+        )
         self._operator_views: dict[Operator, OperatorView] = dict()
         self._channel_views: dict[str, ChannelView] = dict()
+        self._unfinished_channel_rw_views: set[ChannelRWView] = set()
         self._dependency_levels: list[set[Operator]] = order_operators_by_connections(pipeline)
         self._operator_view_channel_reader_count: dict[Operator, int] = dict()
         self._operator_view_channel_writer_count: dict[Operator, int] = dict()
         self._stopped: bool = False
         self._shutdown: bool = False
         self._start_time: float = 0.0
+        self._displayed_elapsed_time: int = 0
+        self._scroll_region: Optional[tuple[int, int, int, int]] = None
 
         # Initialize graphical elements
         # =============================
@@ -95,7 +104,31 @@ class PipelineSnifferViewer(tk.Tk):
         self.__init_sniffer()
 
     def __on_canvas_configure(self, event):
-        self._pipeline_canvas.configure(scrollregion=self._pipeline_canvas.bbox("all"))
+        # The drawn items don't change their extent after the initialization,
+        # so the bounding box of all items needs to be computed only once.
+        if self._scroll_region is None:
+            self._scroll_region = self._pipeline_canvas.bbox("all")
+
+        self._pipeline_canvas.configure(scrollregion=self._scroll_region)
+
+    def __get_channel_view(self, channel_id: str, reader_operator: Operator, writer_operator: Operator) -> ChannelView:
+        if channel_id not in self._channel_views:
+            channel_reader_idx = self._operator_view_channel_reader_count.get(reader_operator, 0)
+            channel_writer_idx = self._operator_view_channel_writer_count.get(writer_operator, 0)
+
+            self._channel_views[channel_id] = ChannelView(self._pipeline_canvas, channel_reader_idx, channel_writer_idx)
+            self._operator_view_channel_reader_count[reader_operator] = channel_reader_idx + 1
+            self._operator_view_channel_writer_count[writer_operator] = channel_writer_idx + 1
+
+        return self._channel_views[channel_id]
+
+    def __create_channel_rw_view(self, channel_id: str, port: PortPlugin, port_view: PortView) -> ChannelRWView:
+        channel_rw_view = ChannelRWView(self._pipeline_canvas, self._unfinished_channel_rw_views.discard)
+        self._unfinished_channel_rw_views.add(channel_rw_view)
+        self._pipeline_sniffer.channel_sniffers[channel_id].subscribe(port.get_full_name(), channel_rw_view.on_update)
+        port_view.channel_views.append(channel_rw_view)
+
+        return channel_rw_view
 
     def __init_sniffer(self):
         for operator in self._pipeline.get_protected().get_nested_instances().values():
@@ -106,64 +139,30 @@ class PipelineSnifferViewer(tk.Tk):
                 for output_port in input_port.get_connected_ports():
                     if isinstance(output_port, ChannelOutputPort):
                         channel_id = PipelineSniffer.get_channel_id(input_port, output_port)
-
-                        if channel_id not in self._channel_views:
-                            if operator not in self._operator_view_channel_reader_count:
-                                self._operator_view_channel_reader_count[operator] = 0
-                            if output_port.get_context() not in self._operator_view_channel_writer_count:
-                                self._operator_view_channel_writer_count[output_port.get_context()] = 0
-
-                            self._channel_views[channel_id] = \
-                                ChannelView(self._pipeline_canvas,
-                                            self._operator_view_channel_reader_count[operator],
-                                            self._operator_view_channel_writer_count[output_port.get_context()])
-                            self._operator_view_channel_reader_count[operator] += 1
-                            self._operator_view_channel_writer_count[output_port.get_context()] += 1
-
-                        channel_reader_view = ChannelRWView(self._pipeline_canvas)
-                        self._pipeline_sniffer.channel_sniffers[channel_id].subscribe(input_port.get_full_name(),
-                                                                                      channel_reader_view.on_update)
-                        input_port_view.channel_views.append(channel_reader_view)
-                        self._channel_views[channel_id].channel_reader_views.append(channel_reader_view)
+                        channel_view = self.__get_channel_view(channel_id, operator, output_port.get_context())
+                        channel_view.channel_reader_views.append(
+                            self.__create_channel_rw_view(channel_id, input_port, input_port_view)
+                        )
 
             for output_port, output_port_view in operator_view.output_port_views.items():
                 for input_port in output_port.get_connected_ports():
                     if isinstance(input_port, ChannelInputPort):
                         channel_id = PipelineSniffer.get_channel_id(input_port, output_port)
+                        channel_view = self.__get_channel_view(channel_id, input_port.get_context(), operator)
+                        channel_view.channel_writer_views.append(
+                            self.__create_channel_rw_view(channel_id, output_port, output_port_view)
+                        )
 
-                        if channel_id not in self._channel_views:
-                            if operator not in self._operator_view_channel_writer_count:
-                                self._operator_view_channel_writer_count[operator] = 0
-                            if input_port.get_context() not in self._operator_view_channel_reader_count:
-                                self._operator_view_channel_reader_count[input_port.get_context()] = 0
-
-                            self._channel_views[channel_id] = \
-                                ChannelView(self._pipeline_canvas,
-                                            self._operator_view_channel_reader_count[input_port.get_context()],
-                                            self._operator_view_channel_writer_count[operator])
-                            self._operator_view_channel_writer_count[operator] += 1
-                            self._operator_view_channel_reader_count[input_port.get_context()] += 1
-
-                        channel_writer_view = ChannelRWView(self._pipeline_canvas)
-                        self._pipeline_sniffer.channel_sniffers[channel_id].subscribe(output_port.get_full_name(),
-                                                                                      channel_writer_view.on_update)
-                        output_port_view.channel_views.append(channel_writer_view)
-                        self._channel_views[channel_id].channel_writer_views.append(channel_writer_view)
-
+        level_spacing_x = ViewConfig.operator_width + ViewConfig.operator_spacing_hor
         next_y = ViewConfig.operator_start_pos_y
         for idx, level in enumerate(self._dependency_levels):
+            level_x = ViewConfig.operator_start_pos_x + idx * level_spacing_x
             next_y = ViewConfig.operator_start_pos_y
             for operator in level:
-                self._operator_views[operator].draw(ViewConfig.operator_start_pos_x + idx *
-                                                    (ViewConfig.operator_width + ViewConfig.operator_spacing_hor),
-                                                    next_y)
-                next_y = ViewConfig.replica_spacing_ver + self._operator_views[operator].bottom
-
-                for replica in operator.get_replicas():
-                    self._operator_views[replica].draw(ViewConfig.operator_start_pos_x + idx *
-                                                       (ViewConfig.operator_width + ViewConfig.operator_spacing_hor),
-                                                       next_y)
-                    next_y = ViewConfig.replica_spacing_ver + self._operator_views[replica].bottom
+                for group_member in (operator, *operator.get_replicas()):
+                    operator_view = self._operator_views[group_member]
+                    operator_view.draw(level_x, next_y)
+                    next_y = ViewConfig.replica_spacing_ver + operator_view.bottom
 
                 next_y += ViewConfig.operator_spacing_ver
 
@@ -179,46 +178,42 @@ class PipelineSnifferViewer(tk.Tk):
             return
 
         if self._pipeline_sniffer.start():
-            self._start_time = time.time()
+            self._start_time = time.monotonic()
             self._sniffer_status.config(text="Status: Running")
             self.after(100, self.__sniff)
         else:
             self.after(1000, self.__start_sniffer)
 
     def __sniff(self):
-        self._elapsed_time_display.config(text=f"Elapsed time: {round(time.time() - self._start_time)} [sec]")
-
-        for future in self._sniffer_futures:
-            if future.cancelled():
-                continue
-            if not future.done():
-                self.after(1000, self.__sniff)
-                return
+        elapsed_time = round(time.monotonic() - self._start_time)
+        if elapsed_time != self._displayed_elapsed_time:
+            self._elapsed_time_display.config(text=f"Elapsed time: {elapsed_time} [sec]")
+            self._displayed_elapsed_time = elapsed_time
 
         if self._shutdown:
             self._sniffer_status.config(text="Status: Stopping")
             self.after(0, self.__stop_sniffer)
             return
 
-        all_finished = True
-        for channel_view in self._channel_views.values():
-            for channel_reader_view in channel_view.channel_reader_views:
-                if not channel_reader_view.is_finished:
-                    all_finished = False
-                    break
-            for channel_writer_view in channel_view.channel_writer_views:
-                if not channel_writer_view.is_finished:
-                    all_finished = False
-                    break
-            if not all_finished:
-                break
-
-        if all_finished:
+        if 0 == len(self._unfinished_channel_rw_views):
             self.after(0, self.__stop_sniffer)
         else:
-            self._sniffer_futures = {self._executor.submit(channel_sniffer.sniff) for
-                                     channel_sniffer in self._pipeline_sniffer.channel_sniffers.values()}
-            self.after(1000, self.__sniff)
+            self._pending_sniff_count = len(self._sniff_methods)
+            self._sniff_submission_time = time.monotonic()
+            for sniff in self._sniff_methods:
+                self._executor.submit(sniff).add_done_callback(self.__on_sniff_done)
+
+    def __on_sniff_done(self, future: Future):
+        # Invoked on the executor threads or on cancellation, hence
+        # the bookkeeping is passed over to the event loop of Tk.
+        self.after(0, self.__on_sniff_finished)
+
+    def __on_sniff_finished(self):
+        self._pending_sniff_count -= 1
+
+        if 0 == self._pending_sniff_count:
+            elapsed_ms = int((time.monotonic() - self._sniff_submission_time) * 1000)
+            self.after(max(0, 1000 - elapsed_ms), self.__sniff)
 
     def __stop_sniffer(self):
         if self._pipeline_sniffer.stop():
@@ -14,7 +14,7 @@
 # limitations under the License.
 # =============================================================================
 import tkinter as tk
-from typing import Optional
+from typing import Callable, Optional
 
 from pypz.abstracts.channel_ports import ChannelInputPort, ChannelOutputPort
 from pypz.core.channels.status import ChannelStatusMessage, ChannelStatus
@@ -63,76 +63,76 @@ class ChannelView:
         self.y2: Optional[int] = None
 
     def draw(self, next_available_y_position: int):
-        first_channel_reader: ChannelRWView = min(self.channel_reader_views, key=lambda cr: cr.top)
-        last_channel_reader: ChannelRWView = max(self.channel_reader_views, key=lambda cr: cr.top)
-        first_channel_writer: ChannelRWView = min(self.channel_writer_views, key=lambda cr: cr.top)
-        last_channel_writer: ChannelRWView = max(self.channel_writer_views, key=lambda cr: cr.top)
+        channel_readers: list[ChannelRWView] = sorted(self.channel_reader_views, key=lambda cr: cr.top)
+        channel_writers: list[ChannelRWView] = sorted(self.channel_writer_views, key=lambda cw: cw.top)
+
+        first_channel_reader: ChannelRWView = channel_readers[0]
+        last_channel_reader: ChannelRWView = channel_readers[-1]
+        first_channel_writer: ChannelRWView = channel_writers[0]
+        last_channel_writer: ChannelRWView = channel_writers[-1]
 
         channel_reader_x_min: float = first_channel_reader.left
-        channel_reader_y_min: float = \
-            first_channel_reader.top + (first_channel_reader.bottom - first_channel_reader.top) / 2
-        channel_reader_y_max: float = \
-            last_channel_reader.top + (last_channel_reader.bottom - last_channel_reader.top) / 2
+        channel_reader_y_min: float = first_channel_reader.center_y
+        channel_reader_y_max: float = last_channel_reader.center_y
 
         channel_writer_x_max: float = first_channel_writer.right
-        channel_writer_y_min: float = \
-            first_channel_writer.top + (first_channel_writer.bottom - first_channel_writer.top) / 2
-        channel_writer_y_max: float = \
-            last_channel_writer.top + (last_channel_writer.bottom - last_channel_writer.top) / 2
+        channel_writer_y_min: float = first_channel_writer.center_y
+        channel_writer_y_max: float = last_channel_writer.center_y
 
         self.x1 = int(channel_reader_x_min - 50 - 20 * self.channel_reader_idx)
         self.y1 = int(channel_reader_y_min + (channel_reader_y_max - channel_reader_y_min) / 2)
         self.x2 = int(channel_writer_x_max + 50 + 20 * self.channel_writer_idx)
         self.y2 = int(channel_writer_y_min + (channel_writer_y_max - channel_writer_y_min) / 2)
 
-        for idx, channel_reader in enumerate(self.channel_reader_views):
-            self.canvas.create_line(self.x1,
-                                    channel_reader.top + (channel_reader.bottom - channel_reader.top) / 2,
-                                    channel_reader_x_min - 5,
-                                    channel_reader.top + (channel_reader.bottom - channel_reader.top) / 2,
+        for channel_reader in self.channel_reader_views:
+            self.canvas.create_line(self.x1, channel_reader.center_y, channel_reader_x_min - 5, channel_reader.center_y,
                                     arrow=tk.LAST)
 
-        for idx, channel_writer in enumerate(self.channel_writer_views):
-            self.canvas.create_line(channel_writer.right + 5,
-                                    channel_writer.top + (channel_writer.bottom - channel_writer.top) / 2,
-                                    self.x2,
-                                    channel_writer.top + (channel_writer.bottom - channel_writer.top) / 2)
-
         self.canvas.create_oval(self.x1 - 3, self.y1 - 3, self.x1 + 3, self.y1 + 3, fill="black")
         self.canvas.create_oval(self.x2 - 3, self.y2 - 3, self.x2 + 3, self.y2 + 3, fill="black")
 
-        self.canvas.create_line(self.x1, self.y1, self.x1 - 10, self.y1)
-        self.canvas.create_line(self.x2 + 10, self.y2, self.x2, self.y2)
-        self.canvas.create_line(self.x2, channel_writer_y_min, self.x2, channel_writer_y_max)
-        self.canvas.create_line(self.x1, channel_reader_y_min, self.x1, channel_reader_y_max)
-
         next_available_y_position += 20
 
+        # All the non-arrowed segments of the channel are drawn as a single polyline to spare
+        # the Tcl round-trips. Segments are walked back and forth where necessary, which
+        # renders identically to the separately drawn segments.
+
+        coords: list[float] = list()
+
+        for channel_writer in channel_writers:
+            coords.extend((self.x2, channel_writer.center_y, channel_writer.right + 5, channel_writer.center_y,
+                           self.x2, channel_writer.center_y))
+
+        coords.extend((self.x2, self.y2, self.x2 + 10, self.y2))
+
         if self.x1 < self.x2:
-            self.canvas.create_line(self.x1 - 10, self.y1, self.x1 - 10, next_available_y_position)
-            self.canvas.create_line(self.x2 + 10, self.y2, self.x2 + 10, next_available_y_position)
+            coords.extend((self.x2 + 10, next_available_y_position,
+                           self.x1 - 10, next_available_y_position))
 
-            self.canvas.create_line(self.x1 - 10, next_available_y_position,
-                                    self.x2 + 10, next_available_y_position)
-        else:
-            self.canvas.create_line(self.x1 - 10, self.y1, self.x2 + 10, self.y2)
+        coords.extend((self.x1 - 10, self.y1, self.x1, self.y1,
+                       self.x1, channel_reader_y_min, self.x1, channel_reader_y_max))
+
+        self.canvas.create_line(*coords)
 
         return next_available_y_position
 
 
 class ChannelRWView:
-    def __init__(self, canvas: tk.Canvas):
+    def __init__(self, canvas: tk.Canvas, on_finished: Optional[Callable[['ChannelRWView'], None]] = None):
         self.canvas = canvas
+        self.on_finished: Optional[Callable[['ChannelRWView'], None]] = on_finished
 
         self.channel_box: Optional[int] = None
         self.channel_text: Optional[int] = None
         self.status_display_l: Optional[int] = None
         self.status_display_r: Optional[int] = None
+        self.status_display_tag: str = f"status_display_{id(self)}"
 
         self.left: Optional[int] = None
         self.top: Optional[int] = None
         self.right: Optional[int] = None
         self.bottom: Optional[int] = None
+        self.center_y: Optional[float] = None
 
         self.is_finished: bool = False
         self.is_error: bool = False
@@ -142,25 +142,23 @@ class ChannelRWView:
         self.last_status_message_timestamp = status_message.timestamp
 
         if ChannelStatus.Opened == status_message.status:
-            self.canvas.itemconfig(self.status_display_l, fill="yellow")
-            self.canvas.itemconfig(self.status_display_r, fill="yellow")
+            self.canvas.itemconfig(self.status_display_tag, fill="yellow")
         elif ChannelStatus.Started == status_message.status:
-            self.canvas.itemconfig(self.status_display_l, fill="green")
-            self.canvas.itemconfig(self.status_display_r, fill="green")
+            self.canvas.itemconfig(self.status_display_tag, fill="green")
         elif ChannelStatus.Error == status_message.status:
-            self.canvas.itemconfig(self.status_display_l, fill="red")
-            self.canvas.itemconfig(self.status_display_r, fill="red")
+            self.canvas.itemconfig(self.status_display_tag, fill="red")
             self.is_error = True
         elif ChannelStatus.Stopped == status_message.status:
             if not self.is_error:
-                self.canvas.itemconfig(self.status_display_l, fill="blue")
-                self.canvas.itemconfig(self.status_display_r, fill="blue")
+                self.canvas.itemconfig(self.status_display_tag, fill="blue")
         elif ChannelStatus.Closed == status_message.status:
             if not self.is_error:
-                self.canvas.itemconfig(self.status_display_l, fill="lightgrey")
-                self.canvas.itemconfig(self.status_display_r, fill="lightgrey")
+                self.canvas.itemconfig(self.status_display_tag, fill="lightgrey")
             self.is_finished = True
 
+            if self.on_finished is not None:
+                self.on_finished(self)
+
         if status_message.payload is not None:
             if "sentRecordCount" in status_message.payload:
                 self.canvas.itemconfig(self.channel_text, text=status_message.payload["sentRecordCount"])
@@ -172,6 +170,7 @@ class ChannelRWView:
         self.top = right
         self.right = left + ViewConfig.channel_width
         self.bottom = right + ViewConfig.channel_cell_height
+        self.center_y = self.top + ViewConfig.channel_cell_height / 2
 
         self.channel_box = self.canvas.create_rectangle(self.left, self.top, self.right, self.bottom,
                                                         outline="", fill="white")
@@ -180,9 +179,9 @@ class ChannelRWView:
                                                     text="0", fill="black", justify=tk.CENTER)
 
         self.status_display_l = self.canvas.create_rectangle(self.left, self.top, self.left + 10, self.bottom,
-                                                             outline="", fill="gray")
+                                                             outline="", fill="gray", tags=self.status_display_tag)
         self.status_display_r = self.canvas.create_rectangle(self.right - 10, self.top, self.right, self.bottom,
-                                                             outline="", fill="gray")
+                                                             outline="", fill="gray", tags=self.status_display_tag)
 
 
 class PortView:
@@ -214,8 +213,9 @@ class PortView:
                                                       self.top + 8,
                                                       text=self.port_name, fill="white", justify=tk.CENTER)
 
+        channel_row_height = ViewConfig.channel_cell_height + 1
         for idx, channel_view in enumerate(self.channel_views):
-            channel_view.draw(self.left, self.top + 20 + idx * (ViewConfig.channel_cell_height + 1))
+            channel_view.draw(self.left, self.top + 20 + idx * channel_row_height)
 
 
 class OperatorView:
@@ -224,15 +224,14 @@ class OperatorView:
         self.canvas = canvas
         self.name: str = operator.get_simple_name()
 
-        self.input_port_views: dict[ChannelInputPort, PortView] = {
-            input_port: PortView(canvas, input_port.get_simple_name()) for input_port in
-            operator.get_protected().get_nested_instances().values() if isinstance(input_port, ChannelInputPort)
-        }
+        self.input_port_views: dict[ChannelInputPort, PortView] = dict()
+        self.output_port_views: dict[ChannelOutputPort, PortView] = dict()
 
-        self.output_port_views: dict[ChannelOutputPort, PortView] = {
-            output_port: PortView(canvas, output_port.get_simple_name()) for output_port in
-            operator.get_protected().get_nested_instances().values() if isinstance(output_port, ChannelOutputPort)
-        }
+        for plugin in operator.get_protected().get_nested_instances().values():
+            if isinstance(plugin, ChannelInputPort):
+                self.input_port_views[plugin] = PortView(canvas, plugin.get_simple_name())
+            elif isinstance(plugin, ChannelOutputPort):
+                self.output_port_views[plugin] = PortView(canvas, plugin.get_simple_name())
 
         self.left: Optional[int] = None
         self.top: Optional[int] = None
@@ -55,10 +55,8 @@ class TestPipelineWithSimpleConnections(Pipeline):
         self.op_c = TestOperator()
         self.op_d = TestOperator()
 
-        self.op_a.set_parameter("replicationFactor", replication_factor)
-        self.op_b.set_parameter("replicationFactor", replication_factor)
-        self.op_c.set_parameter("replicationFactor", replication_factor)
-        self.op_d.set_parameter("replicationFactor", replication_factor)
+        for operator in (self.op_a, self.op_b, self.op_c, self.op_d):
+            operator.set_parameter("replicationFactor", replication_factor)
 
         self.op_d.input_port.connect(self.op_c.output_port)
         self.op_c.input_port.connect(self.op_b.output_port)
@@ -78,13 +76,8 @@ class TestPipelineWithBranchingConnections(Pipeline):
         self.op_f = TestOperator()
         self.op_g = TestOperator()
 
-        self.op_a.set_parameter("replicationFactor", replication_factor)
-        self.op_b.set_parameter("replicationFactor", replication_factor)
-        self.op_c.set_parameter("replicationFactor", replication_factor)
-        self.op_d.set_parameter("replicationFactor", replication_factor)
-        self.op_e.set_parameter("replicationFactor", replication_factor)
-        self.op_f.set_parameter("replicationFactor", replication_factor)
-        self.op_g.set_parameter("replicationFactor", replication_factor)
+        for operator in (self.op_a, self.op_b, self.op_c, self.op_d, self.op_e, self.op_f, self.op_g):
+            operator.set_parameter("replicationFactor", replication_factor)
 
         self.op_a.output_port.connect(self.op_b.input_port)
         self.op_a.output_port.connect(self.op_c.input_port)
@@ -109,13 +102,8 @@ class TestPipelineWithMergingConnections(Pipeline):
         self.op_f = TestOperator()
         self.op_g = TestOperator()
 
-        self.op_a.set_parameter("replicationFactor", replication_factor)
-        self.op_b.set_parameter("replicationFactor", replication_factor)
-        self.op_c.set_parameter("replicationFactor", replication_factor)
-        self.op_d.set_parameter("replicationFactor", replication_factor)
-        self.op_e.set_parameter("replicationFactor", replication_factor)
-        self.op_f.set_parameter("replicationFactor", replication_factor)
-        self.op_g.set_parameter("replicationFactor", replication_factor)
+        for operator in (self.op_a, self.op_b, self.op_c, self.op_d, self.op_e, self.op_f, self.op_g):
+            operator.set_parameter("replicationFactor", replication_factor)
 
         self.op_a.input_port.connect(self.op_b.output_port)
         self.op_a.input_port.connect(self.op_c.output_port)
@@ -141,14 +129,8 @@ class TestPipelineWithBranchingAndMergingConnections(Pipeline):
         self.op_g = TestOperator()
         self.op_h = TestOperator()
 
-        self.op_a.set_parameter("replicationFactor", replication_factor)
-        self.op_b.set_parameter("replicationFactor", replication_factor)
-        self.op_c.set_parameter("replicationFactor", replication_factor)
-        self.op_d.set_parameter("replicationFactor", replication_factor)
-        self.op_e.set_parameter("replicationFactor", replication_factor)
-        self.op_f.set_parameter("replicationFactor", replication_factor)
-        self.op_g.set_parameter("replicationFactor", replication_factor)
-        self.op_h.set_parameter("replicationFactor", replication_factor)
+        for operator in (self.op_a, self.op_b, self.op_c, self.op_d, self.op_e, self.op_f, self.op_g, self.op_h):
+            operator.set_parameter("replicationFactor", replication_factor)
 
         self.op_a.output_port.connect(self.op_c.input_port)
         self.op_b.output_port.connect(self.op_c.input_port)
@@ -177,32 +159,16 @@ class TestPipelineWithBranchingAndMergingConnectionsWithMultipleOutputs(Pipeline
         self.op_g = TestOperator()
         self.op_h = TestOperator()
 
-        self.op_a.set_parameter("replicationFactor", replication_factor)
-        self.op_b.set_parameter("replicationFactor", replication_factor)
-        self.op_c.set_parameter("replicationFactor", replication_factor)
-        self.op_d.set_parameter("replicationFactor", replication_factor)
-        self.op_e.set_parameter("replicationFactor", replication_factor)
-        self.op_f.set_parameter("replicationFactor", replication_factor)
-        self.op_g.set_parameter("replicationFactor", replication_factor)
-        self.op_h.set_parameter("replicationFactor", replication_factor)
+        for operator in (self.op_a, self.op_b, self.op_c, self.op_d, self.op_e, self.op_f, self.op_g, self.op_h):
+            operator.set_parameter("replicationFactor", replication_factor)
 
-        self.op_a.output_port.connect(self.op_c.input_port)
-        self.op_b.output_port.connect(self.op_c.input_port)
-        self.op_c.output_port.connect(self.op_d.input_port)
-        self.op_c.output_port.connect(self.op_e.input_port)
-        self.op_d.output_port.connect(self.op_f.input_port)
-        self.op_e.output_port.connect(self.op_f.input_port)
-        self.op_f.output_port.connect(self.op_g.input_port)
-        self.op_f.output_port.connect(self.op_h.input_port)
-
-        self.op_a.output_port_2.connect(self.op_c.input_port)
-        self.op_b.output_port_2.connect(self.op_c.input_port)
-        self.op_c.output_port_2.connect(self.op_d.input_port)
-        self.op_c.output_port_2.connect(self.op_e.input_port)
-        self.op_d.output_port_2.connect(self.op_f.input_port)
-        self.op_e.output_port_2.connect(self.op_f.input_port)
-        self.op_f.output_port_2.connect(self.op_g.input_port)
-        self.op_f.output_port_2.connect(self.op_h.input_port)
+        # Both output ports are wired along the same topology
+        for source_operator, target_operator in ((self.op_a, self.op_c), (self.op_b, self.op_c),
+                                                 (self.op_c, self.op_d), (self.op_c, self.op_e),
+                                                 (self.op_d, self.op_f), (self.op_e, self.op_f),
+                                                 (self.op_f, self.op_g), (self.op_f, self.op_h)):
+            source_operator.output_port.connect(target_operator.input_port)
+            source_operator.output_port_2.connect(target_operator.input_port)
 
 
 class TestPipelineWithBranchingAndMergingConnectionsWithAdditionalOutputs(Pipeline):
@@ -219,14 +185,8 @@ class TestPipelineWithBranchingAndMergingConnectionsWithAdditionalOutputs(Pipeli
         self.op_g = TestOperator()
         self.op_h = TestOperator()
 
-        self.op_a.set_parameter("replicationFactor", replication_factor)
-        self.op_b.set_parameter("replicationFactor", replication_factor)
-        self.op_c.set_parameter("replicationFactor", replication_factor)
-        self.op_d.set_parameter("replicationFactor", replication_factor)
-        self.op_e.set_parameter("replicationFactor", replication_factor)
-        self.op_f.set_parameter("replicationFactor", replication_factor)
-        self.op_g.set_parameter("replicationFactor", replication_factor)
-        self.op_h.set_parameter("replicationFactor", replication_factor)
+        for operator in (self.op_a, self.op_b, self.op_c, self.op_d, self.op_e, self.op_f, self.op_g, self.op_h):
+            operator.set_parameter("replicationFactor", replication_factor)
 
         self.op_a.output_port.connect(self.op_c.input_port)
         self.op_b.output_port.connect(self.op_c.input_port)
@@ -249,12 +209,29 @@ class TestPipelineWithCircularDependentOperators(Pipeline):
         self.op_c = TestOperator()
         self.op_d = TestOperator()
 
-        self.op_a.set_parameter("replicationFactor", replication_factor)
-        self.op_b.set_parameter("replicationFactor", replication_factor)
-        self.op_c.set_parameter("replicationFactor", replication_factor)
-        self.op_d.set_parameter("replicationFactor", replication_factor)
+        for operator in (self.op_a, self.op_b, self.op_c, self.op_d):
+            operator.set_parameter("replicationFactor", replication_factor)
 
         self.op_d.input_port.connect(self.op_c.output_port)
         self.op_c.input_port.connect(self.op_b.output_port)
         self.op_b.input_port.connect(self.op_a.output_port)
         self.op_a.input_port.connect(self.op_d.output_port)
+
+
+class TestPipelineWithCircularDependentOperatorsAfterSource(Pipeline):
+
+    def __init__(self, name: str = None, replication_factor=0, *args, **kwargs):
+        super().__init__(name, *args, **kwargs)
+
+        self.op_a = TestOperator()
+        self.op_b = TestOperator()
+        self.op_c = TestOperator()
+        self.op_d = TestOperator()
+
+        for operator in (self.op_a, self.op_b, self.op_c, self.op_d):
+            operator.set_parameter("replicationFactor", replication_factor)
+
+        self.op_b.input_port.connect(self.op_a.output_port)
+        self.op_c.input_port.connect(self.op_b.output_port)
+        self.op_d.input_port.connect(self.op_c.output_port)
+        self.op_b.input_port_2.connect(self.op_d.output_port)
@@ -19,32 +19,37 @@ from pypz.sniffer.utils import retrieve_operator_paths, is_sublist, order_operat
 from sniffer.test.resources import TestPipelineWithSimpleConnections, TestPipelineWithBranchingConnections, \
     TestPipelineWithCircularDependentOperators, TestPipelineWithMergingConnections, \
     TestPipelineWithBranchingAndMergingConnections, TestPipelineWithBranchingAndMergingConnectionsWithMultipleOutputs, \
-    TestPipelineWithBranchingAndMergingConnectionsWithAdditionalOutputs
+    TestPipelineWithBranchingAndMergingConnectionsWithAdditionalOutputs, \
+    TestPipelineWithCircularDependentOperatorsAfterSource
 
 
 class GraphResolutionTest(unittest.TestCase):
 
     def test_is_sublist_cases(self):
-        self.assertTrue(is_sublist([], []))
-        self.assertTrue(is_sublist([], [0]))
-        self.assertTrue(is_sublist([0], [0]))
-        self.assertTrue(is_sublist([0], [0, 1, 2, 3, 4]))
-        self.assertTrue(is_sublist([0, 1], [0, 1, 2, 3, 4]))
-        self.assertTrue(is_sublist([0, 1, 2], [0, 1, 2, 3, 4]))
-        self.assertTrue(is_sublist([0, 1, 2, 3], [0, 1, 2, 3, 4]))
-        self.assertTrue(is_sublist([0, 1, 2, 3, 4], [0, 1, 2, 3, 4]))
-        self.assertTrue(is_sublist([4], [0, 1, 2, 3, 4]))
-        self.assertTrue(is_sublist([3, 4], [0, 1, 2, 3, 4]))
-        self.assertTrue(is_sublist([0, 1, 2, 3, 4], [0, 1, 2, 3, 4]))
-        self.assertTrue(is_sublist([2, 3, 4], [0, 1, 2, 3, 4]))
-        self.assertTrue(is_sublist([1, 2, 3, 4], [0, 1, 2, 3, 4]))
-
-        self.assertFalse(is_sublist([0], []))
-        self.assertFalse(is_sublist([0, 1], [0]))
-        self.assertFalse(is_sublist([0, 0], [0, 1, 2, 3, 4]))
-        self.assertFalse(is_sublist([0, 2], [0, 1, 2, 3, 4]))
-        self.assertFalse(is_sublist([4, 3], [0, 1, 2, 3, 4]))
-        self.assertFalse(is_sublist(["3", "4"], [0, 1, 2, 3, 4]))
+        # (expected result, subset, target list)
+        for expected, subset, target_list in [
+            (True, [], []),
+            (True, [], [0]),
+            (True, [0], [0]),
+            (True, [0], [0, 1, 2, 3, 4]),
+            (True, [0, 1], [0, 1, 2, 3, 4]),
+            (True, [0, 1, 2], [0, 1, 2, 3, 4]),
+            (True, [0, 1, 2, 3], [0, 1, 2, 3, 4]),
+            (True, [0, 1, 2, 3, 4], [0, 1, 2, 3, 4]),
+            (True, [4], [0, 1, 2, 3, 4]),
+            (True, [3, 4], [0, 1, 2, 3, 4]),
+            (True, [0, 1, 2, 3, 4], [0, 1, 2, 3, 4]),
+            (True, [2, 3, 4], [0, 1, 2, 3, 4]),
+            (True, [1, 2, 3, 4], [0, 1, 2, 3, 4]),
+            (False, [0], []),
+            (False, [0, 1], [0]),
+            (False, [0, 0], [0, 1, 2, 3, 4]),
+            (False, [0, 2], [0, 1, 2, 3, 4]),
+            (False, [4, 3], [0, 1, 2, 3, 4]),
+            (False, ["3", "4"], [0, 1, 2, 3, 4]),
+        ]:
+            with self.subTest(subset=subset, target_list=target_list):
+                self.assertEqual(expected, is_sublist(subset, target_list))
 
     def test_path_retrieval_with_normal_pipeline(self):
         pipeline = TestPipelineWithSimpleConnections("pipeline")
@@ -161,6 +166,19 @@ class GraphResolutionTest(unittest.TestCase):
         self.assertEqual(4, len(path[0]))
         self.assertEqual([pipeline.op_d, pipeline.op_a, pipeline.op_b, pipeline.op_c], path[0])
 
+    def test_path_retrieval_with_pipeline_with_circular_dependent_operators_after_source(self):
+        pipeline = TestPipelineWithCircularDependentOperatorsAfterSource("pipeline")
+
+        path = retrieve_operator_paths(pipeline.op_a)
+
+        self.assertEqual(1, len(path))
+        self.assertEqual([pipeline.op_a, pipeline.op_b, pipeline.op_c, pipeline.op_d], path[0])
+
+        path = retrieve_operator_paths(pipeline.op_c)
+
+        self.assertEqual(1, len(path))
+        self.assertEqual([pipeline.op_c, pipeline.op_d, pipeline.op_b], path[0])
+
     def test_order_operators_by_connections_with_normal_pipeline(self):
         pipeline = TestPipelineWithSimpleConnections("pipeline")
 
@@ -197,6 +215,24 @@ class GraphResolutionTest(unittest.TestCase):
         self.assertEqual(1, len(dependency_levels[3]))
         self.assertIn(pipeline.op_d, dependency_levels[3])
 
+    def test_order_operators_by_connections_pipeline_with_circular_dependent_operators_after_source(self):
+        pipeline = TestPipelineWithCircularDependentOperatorsAfterSource("pipeline")
+
+        dependency_levels = order_operators_by_connections(pipeline)
+
+        self.assertEqual(4, len(dependency_levels))
+        self.assertEqual(1, len(dependency_levels[0]))
+        self.assertIn(pipeline.op_a, dependency_levels[0])
+
+        self.assertEqual(1, len(dependency_levels[1]))
+        self.assertIn(pipeline.op_b, dependency_levels[1])
+
+        self.assertEqual(1, len(dependency_levels[2]))
+        self.assertIn(pipeline.op_c, dependency_levels[2])
+
+        self.assertEqual(1, len(dependency_levels[3]))
+        self.assertIn(pipeline.op_d, dependency_levels[3])
+
     def test_order_operators_by_connections_with_branching_pipeline(self):
         pipeline = TestPipelineWithBranchingConnections("pipeline")
 